@@ -0,0 +1,56 @@
+"""
+Batch API routes
+"""
+
+from fastapi import APIRouter, HTTPException, Request
+from typing import Any, Optional
+from urllib.parse import urlsplit
+import httpx
+
+from app.core.config import settings
+from app.models.schemas import BatchRequest, BatchResponse, BatchResponseItem
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+
+
+def _is_batch_url(url: str) -> bool:
+    """Whether a sub-request would call the batch endpoint itself"""
+    path = "/" + urlsplit(url).path.strip("/")
+    if path.startswith(settings.api_v1_prefix + "/"):
+        path = path[len(settings.api_v1_prefix):]
+    return path == router.prefix or path.startswith(router.prefix + "/")
+
+
+def _decode_body(response: httpx.Response) -> Optional[Any]:
+    """Decode a JSON sub-response body; other content types are returned as text"""
+    if not response.content:
+        return None
+    if response.headers.get("content-type", "").startswith("application/json"):
+        return response.json()
+    return response.text
+
+
+@router.post("/", response_model=BatchResponse)
+async def run_batch(
+    batch: BatchRequest,
+    request: Request
+):
+    """Execute several API requests in a single round-trip"""
+    if any(_is_batch_url(item.url) for item in batch.requests):
+        raise HTTPException(status_code=400, detail="Batch requests cannot be nested")
+
+    transport = httpx.ASGITransport(app=request.app)
+    base_url = f"http://batch{settings.api_v1_prefix}"
+    
+    responses = []
+    async with httpx.AsyncClient(transport=transport, base_url=base_url) as client:
+        # Sub-requests run in order so later writes can depend on earlier ones
+        for item in batch.requests:
+            response = await client.request(item.method, item.url, json=item.body)
+            responses.append(BatchResponseItem(
+                id=item.id,
+                status_code=response.status_code,
+                body=_decode_body(response)
+            ))
+    
+    return BatchResponse(responses=responses)
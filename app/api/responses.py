@@ -0,0 +1,26 @@
+"""
+Pre-serialized JSON responses for the busiest routes
+"""
+
+from typing import Any, Iterable, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def dump_model(schema: Type[BaseModel], obj: Any) -> dict:
+    """
+    Validate an ORM object against a schema and dump it to Python types.
+    Datetimes are left as-is; orjson writes them as ISO-8601 natively.
+    """
+    return schema.model_validate(obj).model_dump()
+
+
+def model_response(schema: Type[BaseModel], obj: Any, status_code: int = 200) -> ORJSONResponse:
+    """Return a single object as a response, skipping FastAPI's jsonable_encoder pass"""
+    return ORJSONResponse(dump_model(schema, obj), status_code=status_code)
+
+
+def list_response(schema: Type[BaseModel], objs: Iterable[Any], status_code: int = 200) -> ORJSONResponse:
+    """Return a list of objects as a response, skipping FastAPI's jsonable_encoder pass"""
+    return ORJSONResponse([dump_model(schema, obj) for obj in objs], status_code=status_code)
@@ -3,6 +3,7 @@ Restaurant API routes
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -17,6 +18,7 @@ from app.models.schemas import (
     PaginatedResponse, Error
 )
 from app.models.database import Restaurant as RestaurantModel
+from app.api.responses import dump_model, model_response
 
 router = APIRouter(prefix="/restaurants", tags=["Restaurants"])
 
@@ -32,22 +34,12 @@ async def list_restaurants(
     restaurants = service.get_restaurants(limit=limit, offset=offset)
     total = service.db.query(RestaurantModel).count()
     
-    return PaginatedResponse(
-        items=[{
-            "id": restaurant.id,
-            "name": restaurant.name,
-            "address": restaurant.address,
-            "phone": restaurant.phone,
-            "opening_time": restaurant.opening_time,
-            "closing_time": restaurant.closing_time,
-            "max_capacity": restaurant.max_capacity,
-            "created_at": restaurant.created_at.isoformat(),
-            "updated_at": restaurant.updated_at.isoformat()
-        } for restaurant in restaurants],
-        total=total,
-        limit=limit,
-        offset=offset
-    )
+    return ORJSONResponse({
+        "items": [dump_model(Restaurant, restaurant) for restaurant in restaurants],
+        "total": total,
+        "limit": limit,
+        "offset": offset
+    })
 
 
 @router.post("/", response_model=Restaurant, status_code=201)
@@ -57,7 +49,7 @@ async def create_restaurant(
 ):
     """Create a new restaurant"""
     service = RestaurantService(db)
-    return service.create_restaurant(restaurant_data)
+    return model_response(Restaurant, service.create_restaurant(restaurant_data), status_code=201)
 
 
 @router.get("/{restaurant_id}", response_model=Restaurant)
@@ -70,7 +62,7 @@ async def get_restaurant(
     restaurant = service.get_restaurant(restaurant_id)
     if not restaurant:
         raise HTTPException(status_code=404, detail="Restaurant not found")
-    return restaurant
+    return model_response(Restaurant, restaurant)
 
 
 @router.put("/{restaurant_id}", response_model=Restaurant)
@@ -84,7 +76,7 @@ async def update_restaurant(
     restaurant = service.update_restaurant(restaurant_id, restaurant_data)
     if not restaurant:
         raise HTTPException(status_code=404, detail="Restaurant not found")
-    return restaurant
+    return model_response(Restaurant, restaurant)
 
 
 @router.delete("/{restaurant_id}", status_code=204)
@@ -132,11 +124,13 @@ async def list_tables(
     restaurant_id: str,
     section_id: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
+    min_capacity: Optional[int] = Query(None, ge=1, description="Only return tables seating at least this many people"),
     db: Session = Depends(get_db)
 ):
     """List tables for a restaurant"""
     service = RestaurantService(db)
-    return service.get_tables(restaurant_id=restaurant_id, section_id=section_id, status=status)
+    return service.get_tables(restaurant_id=restaurant_id, section_id=section_id, status=status,
+                              min_capacity=min_capacity)
 
 
 @router.post("/{restaurant_id}/tables", response_model=Table, status_code=201)
@@ -8,7 +8,7 @@ from typing import List, Optional
 
 from app.database.connection import get_db
 from app.services.waiting_list_service import WaitingListService
-from app.models.schemas import WaitingList, WaitingListCreate, WaitingListUpdate
+from app.models.schemas import WaitingList, WaitingListCreate, WaitingListUpdate, WaitingListSeat, TableAssignment
 
 router = APIRouter(prefix="/waiting-list", tags=["Waiting List"])
 
@@ -19,7 +19,7 @@ async def list_waiting_list(
     status: Optional[str] = Query(None, description="Filter waiting list by status"),
     db: Session = Depends(get_db)
 ):
-    """List all waiting list entries"""
+    """List all waiting list entries, ordered by request time (oldest first)"""
     service = WaitingListService(db)
     return service.get_waiting_list(restaurant_id=restaurant_id, status=status)
 
@@ -72,6 +72,28 @@ async def remove_from_waiting_list(
         raise HTTPException(status_code=404, detail="Waiting list entry not found")
 
 
+@router.post("/{waiting_list_id}/seat", response_model=TableAssignment, status_code=201)
+async def seat_waiting_party(
+    waiting_list_id: str,
+    seat_data: WaitingListSeat,
+    db: Session = Depends(get_db)
+):
+    """Seat a party from the waiting list at a table in a single transaction"""
+    service = WaitingListService(db)
+    try:
+        assignment = service.seat_waiting_party(
+            waiting_list_id,
+            table_id=seat_data.table_id,
+            server_id=seat_data.server_id,
+            notes=seat_data.notes
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not assignment:
+        raise HTTPException(status_code=404, detail="Waiting list entry not found")
+    return assignment
+
+
 # Restaurant-specific waiting list operations
 @router.get("/restaurants/{restaurant_id}/next", response_model=WaitingList)
 async def get_next_waiting_party(
@@ -0,0 +1,76 @@
+"""
+In-process result cache
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+
+class TTLCache:
+    """Thread-safe, size-bounded cache whose entries expire after a fixed number of seconds.
+
+    Entries are grouped by scope (e.g. a restaurant id) so that every result
+    derived from the same rows can be dropped at once.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # (scope, key) -> (expires_at, value), oldest first; a fixed TTL keeps it in expiry order
+        self._entries: "OrderedDict[Tuple[Hashable, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._scopes: Dict[Hashable, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scope: Hashable, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(scope, key)
+                return None
+            return value
+
+    def set(self, scope: Hashable, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting expired and then oldest entries; a non-positive TTL disables caching"""
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._remove(scope, key)
+            self._entries[(scope, key)] = (now + self.ttl, value)
+            self._scopes.setdefault(scope, set()).add(key)
+
+            while self._entries:
+                (oldest_scope, oldest_key), (expires_at, _) = next(iter(self._entries.items()))
+                if expires_at > now and len(self._entries) <= self.max_entries:
+                    break
+                self._remove(oldest_scope, oldest_key)
+
+    def invalidate(self, scope: Hashable) -> None:
+        """Drop every entry cached under a scope"""
+        with self._lock:
+            for key in self._scopes.pop(scope, ()):
+                del self._entries[(scope, key)]
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, scope: Hashable, key: Hashable) -> None:
+        """Drop one entry; the caller holds the lock"""
+        if self._entries.pop((scope, key), None) is None:
+            return
+        keys = self._scopes[scope]
+        keys.discard(key)
+        if not keys:
+            del self._scopes[scope]
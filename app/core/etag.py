@@ -0,0 +1,69 @@
+"""
+Conditional GET support
+"""
+
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Headers RFC 9110 allows on a 304 alongside the ETag; the CORS layer adds its own outside
+NOT_MODIFIED_HEADERS = {"cache-control", "content-location", "date", "expires", "vary"}
+
+
+class ETagMiddleware:
+    """Tag successful GET responses with a weak ETag and answer a matching If-None-Match with 304
+
+    A plain ASGI middleware, so non-GET requests and non-200 responses pass straight
+    through; add it before CORSMiddleware so 304s still get the CORS headers.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        start_message: Message = {}
+        chunks = []
+        passthrough = False
+
+        async def send_tagged(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            headers = MutableHeaders(raw=list(start_message["headers"]))
+            headers["etag"] = etag
+
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                not_modified = MutableHeaders()
+                for key, value in headers.items():
+                    if key in NOT_MODIFIED_HEADERS:
+                        not_modified.append(key, value)
+                not_modified["etag"] = etag
+                await send({"type": "http.response.start", "status": 304, "headers": not_modified.raw})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start_message, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_tagged)
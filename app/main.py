@@ -5,7 +5,7 @@ Main FastAPI application entry point
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 import uvicorn
@@ -17,8 +17,9 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.core.config import settings
+from app.core.etag import ETagMiddleware
 from app.database.connection import create_tables
-from app.api import restaurants, parties, reservations, waiting_list, servers, assignments
+from app.api import restaurants, parties, reservations, waiting_list, servers, assignments, batch
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,9 +31,13 @@ app = FastAPI(
     description="API for managing restaurant seating, reservations, and table assignments",
     version=settings.app_version,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
+# Conditional GET support; added first so it runs inside the CORS layer
+app.add_middleware(ETagMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -49,6 +54,7 @@ app.include_router(reservations.router, prefix="/api/v1")
 app.include_router(waiting_list.router, prefix="/api/v1")
 app.include_router(servers.router, prefix="/api/v1")
 app.include_router(assignments.router, prefix="/api/v1")
+app.include_router(batch.router, prefix="/api/v1")
 
 # Global exception handlers
 @app.exception_handler(HTTPException)
@@ -3,16 +3,18 @@ Assignment service layer for table and reservation assignments
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select, update
 from typing import List, Optional
 from datetime import datetime
 import uuid
 
+from app.database.connection import list_load_options
 from app.models.database import TableAssignment, ReservationAssignment, Table, Party, Server, Reservation
 from app.models.schemas import (
     TableAssignmentCreate, TableAssignmentUpdate,
     ReservationAssignmentCreate, ReservationAssignmentUpdate
 )
+from app.services.restaurant_service import mark_table_cache_stale
 
 
 class AssignmentService:
@@ -21,22 +23,40 @@ class AssignmentService:
     def __init__(self, db: Session):
         self.db = db
 
+    def claim_table(self, table_id: str, restaurant_id: Optional[str] = None) -> str:
+        """Mark an AVAILABLE table OCCUPIED and return its restaurant id; raises ValueError otherwise"""
+        # A guarded UPDATE (no RETURNING, which MySQL lacks) lets only one concurrent request win
+        conditions = [Table.id == table_id, Table.status == "AVAILABLE"]
+        if restaurant_id is not None:
+            conditions.append(Table.restaurant_id == restaurant_id)
+        result = self.db.execute(update(Table).where(*conditions).values(status="OCCUPIED"))
+        if result.rowcount == 0:
+            raise ValueError("Table is not available for assignment")
+        if restaurant_id is None:
+            restaurant_id = self.db.scalar(select(Table.restaurant_id).where(Table.id == table_id))
+        # Bulk UPDATEs skip mapper events, so flag the restaurant's cached results here
+        mark_table_cache_stale(self.db, restaurant_id)
+        return restaurant_id
+
     # Table Assignment operations
     def create_table_assignment(self, assignment_data: TableAssignmentCreate) -> TableAssignment:
         """Create a new table assignment"""
-        # Check if table is available
-        table = self.db.query(Table).filter(Table.id == assignment_data.table_id).first()
-        if not table or table.status != "AVAILABLE":
-            raise ValueError("Table is not available for assignment")
+        self.claim_table(assignment_data.table_id)
 
-        # Check if party exists and is waiting
-        party = self.db.query(Party).filter(Party.id == assignment_data.party_id).first()
-        if not party or party.status != "WAITING":
+        # Seat the party only if it is still waiting
+        result = self.db.execute(
+            update(Party)
+            .where(Party.id == assignment_data.party_id, Party.status == "WAITING")
+            .values(status="SEATED")
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
             raise ValueError("Party is not available for assignment")
 
         # Check if server exists and is active
         server = self.db.query(Server).filter(Server.id == assignment_data.server_id).first()
         if not server or not server.is_active:
+            self.db.rollback()
             raise ValueError("Server is not available for assignment")
 
         assignment = TableAssignment(
@@ -48,13 +68,6 @@ class AssignmentService:
         )
         
         self.db.add(assignment)
-        
-        # Update table status
-        table.status = "OCCUPIED"
-        
-        # Update party status
-        party.status = "SEATED"
-        
         self.db.commit()
         self.db.refresh(assignment)
         return assignment
@@ -68,7 +81,7 @@ class AssignmentService:
                              server_id: Optional[str] = None,
                              status: Optional[str] = None) -> List[TableAssignment]:
         """Get table assignments with optional filters"""
-        query = self.db.query(TableAssignment)
+        query = self.db.query(TableAssignment).options(*list_load_options())
         
         if table_id:
             query = query.filter(TableAssignment.table_id == table_id)
@@ -187,7 +200,7 @@ class AssignmentService:
                                    server_id: Optional[str] = None,
                                    status: Optional[str] = None) -> List[ReservationAssignment]:
         """Get reservation assignments with optional filters"""
-        query = self.db.query(ReservationAssignment)
+        query = self.db.query(ReservationAssignment).options(*list_load_options())
         
         if reservation_id:
             query = query.filter(ReservationAssignment.reservation_id == reservation_id)
@@ -8,6 +8,7 @@ from typing import List, Optional
 from datetime import datetime, date
 import uuid
 
+from app.database.connection import list_load_options
 from app.models.database import Reservation
 from app.models.schemas import ReservationCreate, ReservationUpdate
 
@@ -43,7 +44,7 @@ class ReservationService:
                         status: Optional[str] = None, 
                         date_filter: Optional[date] = None) -> List[Reservation]:
         """Get reservations with optional filters"""
-        query = self.db.query(Reservation)
+        query = self.db.query(Reservation).options(*list_load_options())
         
         if restaurant_id:
             query = query.filter(Reservation.restaurant_id == restaurant_id)
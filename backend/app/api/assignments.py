@@ -12,6 +12,7 @@ from app.models.schemas import (
     TableAssignment, TableAssignmentCreate, TableAssignmentUpdate,
     ReservationAssignment, ReservationAssignmentCreate, ReservationAssignmentUpdate
 )
+from app.api.responses import list_response, model_response
 
 router = APIRouter(prefix="/assignments", tags=["Assignments"])
 
@@ -27,12 +28,12 @@ async def list_table_assignments(
 ):
     """List all table assignments"""
     service = AssignmentService(db)
-    return service.get_table_assignments(
+    return list_response(TableAssignment, service.get_table_assignments(
         table_id=table_id,
         party_id=party_id,
         server_id=server_id,
         status=status
-    )
+    ))
 
 
 @router.post("/table-assignments", response_model=TableAssignment, status_code=201)
@@ -43,7 +44,7 @@ async def create_table_assignment(
     """Create a new table assignment"""
     service = AssignmentService(db)
     try:
-        return service.create_table_assignment(assignment_data)
+        return model_response(TableAssignment, service.create_table_assignment(assignment_data), status_code=201)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -10,6 +10,7 @@ from datetime import date
 from app.database.connection import get_db
 from app.services.reservation_service import ReservationService
 from app.models.schemas import Reservation, ReservationCreate, ReservationUpdate
+from app.api.responses import list_response, model_response
 
 router = APIRouter(prefix="/reservations", tags=["Reservations"])
 
@@ -23,11 +24,11 @@ async def list_reservations(
 ):
     """List all reservations"""
     service = ReservationService(db)
-    return service.get_reservations(
+    return list_response(Reservation, service.get_reservations(
         restaurant_id=restaurant_id,
         status=status,
         date_filter=date_filter
-    )
+    ))
 
 
 @router.post("/", response_model=Reservation, status_code=201)
@@ -37,7 +38,7 @@ async def create_reservation(
 ):
     """Create a new reservation"""
     service = ReservationService(db)
-    return service.create_reservation(reservation_data)
+    return model_response(Reservation, service.create_reservation(reservation_data), status_code=201)
 
 
 @router.get("/{reservation_id}", response_model=Reservation)
@@ -28,6 +28,14 @@ class Settings(BaseSettings):
     database_user: str = "restaurant_user"
     database_password: str = "restaurant_password"
     database_echo: bool = False
+    # Make list queries raise on relationship lazy loads (used by the test suite)
+    raise_on_lazy_load: bool = False
+    
+    # Caching
+    # Seconds to keep table availability and occupancy results (0 disables).
+    # The cache is per process: leave it off when running several workers.
+    table_cache_ttl: int = 0
+    table_cache_max_entries: int = 1024
     
     # Security
     secret_key: str = "your-secret-key-change-in-production"
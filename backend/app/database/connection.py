@@ -4,7 +4,7 @@ Database connection and session management
 
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, Session, raiseload
 from typing import Generator
 from app.core.config import settings
 
@@ -23,6 +23,14 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def list_load_options() -> tuple:
+    """
+    Loader options for list queries. With settings.raise_on_lazy_load set, lazy-loading
+    a relationship off a listed row raises instead of silently issuing a query per row.
+    """
+    return (raiseload("*"),) if settings.raise_on_lazy_load else ()
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency to get database session
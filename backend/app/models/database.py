@@ -2,7 +2,7 @@
 SQLAlchemy database models
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.dialects.mysql import VARCHAR, TEXT, DATETIME
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -81,6 +81,11 @@ class Table(Base):
     table_assignments = relationship("TableAssignment", back_populates="table", cascade="all, delete-orphan")
     reservation_assignments = relationship("ReservationAssignment", back_populates="table", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Serves availability lookups: filter by restaurant/status and minimum capacity
+        Index("ix_tables_restaurant_status_capacity", "restaurant_id", "status", "capacity"),
+    )
+
 
 class TableSection(Base):
     """Many-to-many relationship between tables and sections"""
@@ -157,6 +162,11 @@ class WaitingList(Base):
     # Relationships
     restaurant = relationship("Restaurant", back_populates="waiting_list")
 
+    __table_args__ = (
+        # Serves the FIFO listing: filter by restaurant/status, ordered by request time
+        Index("ix_waiting_list_restaurant_status_request_time", "restaurant_id", "status", "request_time"),
+    )
+
 
 class Server(Base):
     """Server model"""
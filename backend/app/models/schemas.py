@@ -4,7 +4,7 @@ Based on the OpenAPI specification
 """
 
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List
+from typing import Optional, List, Any, Literal
 from datetime import datetime
 from enum import Enum
 
@@ -225,6 +225,12 @@ class WaitingListUpdate(BaseSchema):
     notes: Optional[str] = Field(None, description="Additional notes about the waiting list entry")
 
 
+class WaitingListSeat(BaseSchema):
+    table_id: str = Field(..., description="ID of the table to seat the party at")
+    server_id: str = Field(..., description="ID of the managing server")
+    notes: Optional[str] = Field(None, description="Additional notes about the assignment")
+
+
 class WaitingList(WaitingListBase):
     id: str = Field(..., description="Unique identifier for the waiting list entry")
     request_time: datetime = Field(..., description="When the customer requested to be added to waiting list")
@@ -333,6 +339,29 @@ class PaginatedResponse(BaseSchema):
     offset: int = Field(..., description="Number of items skipped")
 
 
+# Batch schemas
+class BatchRequestItem(BaseSchema):
+    id: int = Field(..., description="Caller-chosen identifier echoed back in the response")
+    method: Literal["GET", "POST", "PUT", "DELETE"] = Field("GET", description="HTTP method of the sub-request")
+    url: str = Field(..., description="Path (and query string) relative to the API prefix")
+    body: Optional[Any] = Field(None, description="JSON body for POST/PUT sub-requests")
+
+
+class BatchRequest(BaseSchema):
+    requests: List[BatchRequestItem] = Field(..., min_length=1, max_length=20,
+                                             description="Sub-requests to execute in order (at most 20)")
+
+
+class BatchResponseItem(BaseSchema):
+    id: int = Field(..., description="Identifier of the matching sub-request")
+    status_code: int = Field(..., description="HTTP status code of the sub-response")
+    body: Optional[Any] = Field(None, description="Decoded JSON body of the sub-response, or its text if not JSON")
+
+
+class BatchResponse(BaseSchema):
+    responses: List[BatchResponseItem] = Field(..., description="Sub-responses in request order")
+
+
 class TableAvailabilityResponse(BaseSchema):
     available_tables: List[Table] = Field(..., description="List of available tables")
     estimated_wait_time: Optional[int] = Field(None, description="Estimated wait time in minutes if no tables available")
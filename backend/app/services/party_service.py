@@ -7,6 +7,7 @@ from typing import List, Optional
 from datetime import datetime
 import uuid
 
+from app.database.connection import list_load_options
 from app.models.database import Party
 from app.models.schemas import PartyCreate, PartyUpdate
 
@@ -39,7 +40,7 @@ class PartyService:
 
     def get_parties(self, status: Optional[str] = None) -> List[Party]:
         """Get all parties, optionally filtered by status"""
-        query = self.db.query(Party)
+        query = self.db.query(Party).options(*list_load_options())
         if status:
             query = query.filter(Party.status == status)
         return query.all()
@@ -2,20 +2,58 @@
 Restaurant service layer
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from typing import List, Optional
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy import and_, or_, event, func
+from typing import List, Optional, Tuple
 from datetime import datetime, time
 import uuid
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.database.connection import list_load_options
 from app.models.database import Restaurant, Section, Table, Party, Reservation, WaitingList, Server
 from app.models.schemas import (
     RestaurantCreate, RestaurantUpdate, SectionCreate, SectionUpdate,
     TableCreate, TableUpdate, PartyCreate, PartyUpdate,
     ReservationCreate, ReservationUpdate, WaitingListCreate, WaitingListUpdate,
-    ServerCreate, ServerUpdate, TableAvailabilityResponse, OccupancyAnalyticsResponse
+    ServerCreate, ServerUpdate, TableAvailabilityResponse, OccupancyAnalyticsResponse,
+    TableStatus
 )
 
+# Availability and occupancy results, scoped by restaurant id
+table_cache = TTLCache(ttl=settings.table_cache_ttl, max_entries=settings.table_cache_max_entries)
+
+# Session.info key holding the restaurant ids whose tables the open transaction wrote
+_STALE_RESTAURANTS = "stale_table_restaurants"
+
+
+def mark_table_cache_stale(session: Session, restaurant_id: str) -> None:
+    """Drop the restaurant's cached results once the session's transaction commits"""
+    session.info.setdefault(_STALE_RESTAURANTS, set()).add(restaurant_id)
+
+
+@event.listens_for(Table, "after_insert")
+@event.listens_for(Table, "after_update")
+@event.listens_for(Table, "after_delete")
+def _track_table_write(mapper, connection, target):
+    """Remember the restaurant of every flushed table write"""
+    session = object_session(target)
+    if session is not None:
+        mark_table_cache_stale(session, target.restaurant_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_table_cache(session):
+    """Invalidate after commit so a read between flush and commit cannot re-cache old rows"""
+    for restaurant_id in session.info.pop(_STALE_RESTAURANTS, ()):
+        table_cache.invalidate(restaurant_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_table_writes(session):
+    """Rolled-back writes never reached the database, so the cached results still hold"""
+    session.info.pop(_STALE_RESTAURANTS, None)
+
 
 class RestaurantService:
     """Service for restaurant operations"""
@@ -46,7 +84,7 @@ class RestaurantService:
 
     def get_restaurants(self, limit: int = 20, offset: int = 0) -> List[Restaurant]:
         """Get all restaurants with pagination"""
-        return self.db.query(Restaurant).offset(offset).limit(limit).all()
+        return self.db.query(Restaurant).options(*list_load_options()).offset(offset).limit(limit).all()
 
     def update_restaurant(self, restaurant_id: str, restaurant_data: RestaurantUpdate) -> Optional[Restaurant]:
         """Update restaurant"""
@@ -90,7 +128,7 @@ class RestaurantService:
 
     def get_sections(self, restaurant_id: Optional[str] = None) -> List[Section]:
         """Get sections, optionally filtered by restaurant"""
-        query = self.db.query(Section)
+        query = self.db.query(Section).options(*list_load_options())
         if restaurant_id:
             query = query.filter(Section.restaurant_id == restaurant_id)
         return query.all()
@@ -141,15 +179,17 @@ class RestaurantService:
         return table
 
     def get_tables(self, restaurant_id: Optional[str] = None, section_id: Optional[str] = None, 
-                   status: Optional[str] = None) -> List[Table]:
+                   status: Optional[str] = None, min_capacity: Optional[int] = None) -> List[Table]:
         """Get tables with optional filters"""
-        query = self.db.query(Table)
+        query = self.db.query(Table).options(*list_load_options())
         if restaurant_id:
             query = query.filter(Table.restaurant_id == restaurant_id)
         if section_id:
             query = query.join(TableSection).filter(TableSection.section_id == section_id)
         if status:
             query = query.filter(Table.status == status)
+        if min_capacity:
+            query = query.filter(Table.capacity >= min_capacity)
         return query.all()
 
     def get_table(self, table_id: str) -> Optional[Table]:
@@ -184,6 +224,11 @@ class RestaurantService:
     def check_table_availability(self, restaurant_id: str, date_time: datetime, 
                                 party_size: int, duration: int = 120) -> TableAvailabilityResponse:
         """Check table availability for a given time and party size"""
+        cache_key = ("availability", date_time, party_size, duration)
+        cached = table_cache.get(restaurant_id, cache_key)
+        if cached is not None:
+            return cached
+
         # Get available tables that can accommodate the party size
         available_tables = self.db.query(Table).filter(
             and_(
@@ -198,43 +243,51 @@ class RestaurantService:
         estimated_wait_time = None
         if not available_tables:
             # Simple estimation based on current occupancy
-            total_tables = self.db.query(Table).filter(Table.restaurant_id == restaurant_id).count()
-            occupied_tables = self.db.query(Table).filter(
-                and_(
-                    Table.restaurant_id == restaurant_id,
-                    Table.status.in_(["OCCUPIED", "RESERVED"])
-                )
-            ).count()
+            total_tables, occupied_tables = self._count_occupied_tables(restaurant_id)
             
             if total_tables > 0:
                 occupancy_rate = occupied_tables / total_tables
                 estimated_wait_time = int(occupancy_rate * 60)  # Rough estimate in minutes
 
-        return TableAvailabilityResponse(
+        availability = TableAvailabilityResponse(
             available_tables=available_tables,
             estimated_wait_time=estimated_wait_time
         )
+        table_cache.set(restaurant_id, cache_key, availability)
+        return availability
 
     # Occupancy analytics
+    def _count_occupied_tables(self, restaurant_id: str) -> Tuple[int, int]:
+        """Return (total, occupied or reserved) table counts from one grouped query"""
+        counts = dict(
+            self.db.query(Table.status, func.count(Table.id))
+            .filter(Table.restaurant_id == restaurant_id)
+            .group_by(Table.status)
+            .all()
+        )
+        occupied = counts.get(TableStatus.OCCUPIED, 0) + counts.get(TableStatus.RESERVED, 0)
+        return sum(counts.values()), occupied
+
     def get_occupancy_analytics(self, restaurant_id: str, start_date: Optional[datetime] = None,
                                end_date: Optional[datetime] = None) -> OccupancyAnalyticsResponse:
         """Get occupancy analytics for the restaurant"""
-        total_tables = self.db.query(Table).filter(Table.restaurant_id == restaurant_id).count()
-        occupied_tables = self.db.query(Table).filter(
-            and_(
-                Table.restaurant_id == restaurant_id,
-                Table.status.in_(["OCCUPIED", "RESERVED"])
-            )
-        ).count()
+        cache_key = ("occupancy", start_date, end_date)
+        cached = table_cache.get(restaurant_id, cache_key)
+        if cached is not None:
+            return cached
+
+        total_tables, occupied_tables = self._count_occupied_tables(restaurant_id)
 
         current_occupancy = (occupied_tables / total_tables * 100) if total_tables > 0 else 0
 
         # For now, return basic analytics
         # In a real implementation, you'd calculate historical data
-        return OccupancyAnalyticsResponse(
+        analytics = OccupancyAnalyticsResponse(
             current_occupancy=current_occupancy,
             average_occupancy=current_occupancy,  # Simplified
             peak_hours=["19:00", "20:00", "21:00"],  # Placeholder
             total_tables=total_tables,
             occupied_tables=occupied_tables
         )
+        table_cache.set(restaurant_id, cache_key, analytics)
+        return analytics
@@ -7,6 +7,7 @@ from sqlalchemy import and_
 from typing import List, Optional
 import uuid
 
+from app.database.connection import list_load_options
 from app.models.database import Server
 from app.models.schemas import ServerCreate, ServerUpdate
 
@@ -41,7 +42,7 @@ class ServerService:
     def get_servers(self, restaurant_id: Optional[str] = None, 
                    is_active: Optional[bool] = None) -> List[Server]:
         """Get servers with optional filters"""
-        query = self.db.query(Server)
+        query = self.db.query(Server).options(*list_load_options())
         
         if restaurant_id:
             query = query.filter(Server.restaurant_id == restaurant_id)
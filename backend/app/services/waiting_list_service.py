@@ -3,13 +3,15 @@ Waiting list service layer
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, asc
+from sqlalchemy import and_, asc, update
 from typing import List, Optional
 from datetime import datetime
 import uuid
 
-from app.models.database import WaitingList
+from app.database.connection import list_load_options
+from app.models.database import WaitingList, Party, Server, TableAssignment
 from app.models.schemas import WaitingListCreate, WaitingListUpdate
+from app.services.assignment_service import AssignmentService
 
 
 class WaitingListService:
@@ -40,8 +42,8 @@ class WaitingListService:
 
     def get_waiting_list(self, restaurant_id: Optional[str] = None, 
                         status: Optional[str] = None) -> List[WaitingList]:
-        """Get waiting list entries with optional filters"""
-        query = self.db.query(WaitingList)
+        """Get waiting list entries with optional filters, oldest request first"""
+        query = self.db.query(WaitingList).options(*list_load_options())
         
         if restaurant_id:
             query = query.filter(WaitingList.restaurant_id == restaurant_id)
@@ -96,3 +98,53 @@ class WaitingListService:
         self.db.commit()
         self.db.refresh(waiting_list_entry)
         return waiting_list_entry
+
+    def seat_waiting_party(self, waiting_list_id: str, table_id: str, server_id: str,
+                           notes: Optional[str] = None) -> Optional[TableAssignment]:
+        """Seat a waiting party: create the party, assign the table and mark the entry seated"""
+        waiting_list_entry = self.get_waiting_list_entry(waiting_list_id)
+        if not waiting_list_entry:
+            return None
+        restaurant_id = waiting_list_entry.restaurant_id
+
+        # Check if server exists, is active and works at the entry's restaurant
+        server = self.db.query(Server).filter(Server.id == server_id).first()
+        if not server or not server.is_active or server.restaurant_id != restaurant_id:
+            raise ValueError("Server is not available for assignment")
+
+        # Claim the entry and the table with guarded UPDATEs so two requests cannot both seat them
+        result = self.db.execute(
+            update(WaitingList)
+            .where(WaitingList.id == waiting_list_id, WaitingList.status == "WAITING")
+            .values(status="SEATED")
+        )
+        if result.rowcount == 0:
+            raise ValueError("Waiting list entry is not waiting to be seated")
+        try:
+            AssignmentService(self.db).claim_table(table_id, restaurant_id=restaurant_id)
+        except ValueError:
+            self.db.rollback()
+            raise
+
+        party = Party(
+            id=str(uuid.uuid4()),
+            name=waiting_list_entry.customer_name,
+            size=waiting_list_entry.party_size,
+            phone=waiting_list_entry.customer_phone,
+            status="SEATED",
+            arrival_time=waiting_list_entry.request_time
+        )
+        assignment = TableAssignment(
+            id=str(uuid.uuid4()),
+            table_id=table_id,
+            party_id=party.id,
+            server_id=server_id,
+            notes=notes
+        )
+        self.db.add(party)
+        self.db.add(assignment)
+
+        # Everything above is committed together
+        self.db.commit()
+        self.db.refresh(assignment)
+        return assignment
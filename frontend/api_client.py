@@ -3,21 +3,36 @@ API Client for communicating with the Restaurant Seating System backend
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from typing import List, Dict, Optional, Any
+import threading
+from collections import OrderedDict
+from urllib.parse import urlencode
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, date
 import streamlit as st
 
+# Most GET URLs whose last ETag and body the client keeps
+ETAG_CACHE_SIZE = 256
+
+
 class RestaurantAPIClient:
     """Client for interacting with the Restaurant Seating System API"""
     
     def __init__(self, base_url: str = "http://fastapi:8000/api/v1"):
         self.base_url = base_url
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        # Last ETag and body per GET URL, for conditional requests; the client is shared
+        # across Streamlit sessions, so the cache is locked and keeps only recent URLs
+        self._etag_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
     
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
         """Make HTTP request to API"""
@@ -25,7 +40,26 @@ class RestaurantAPIClient:
         
         try:
             if method.upper() == "GET":
-                response = self.session.get(url, params=params)
+                cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+                with self._etag_lock:
+                    cached = self._etag_cache.get(cache_key)
+                headers = {"If-None-Match": cached[0]} if cached else None
+                response = self.session.get(url, params=params, headers=headers)
+                if response.status_code == 304 and cached:
+                    with self._etag_lock:
+                        if cache_key in self._etag_cache:
+                            self._etag_cache.move_to_end(cache_key)
+                    return cached[1]
+                response.raise_for_status()
+                body = response.json() if response.content else {}
+                etag = response.headers.get("ETag")
+                if etag:
+                    with self._etag_lock:
+                        self._etag_cache[cache_key] = (etag, body)
+                        self._etag_cache.move_to_end(cache_key)
+                        while len(self._etag_cache) > ETAG_CACHE_SIZE:
+                            self._etag_cache.popitem(last=False)
+                return body
             elif method.upper() == "POST":
                 response = self.session.post(url, json=data)
             elif method.upper() == "PUT":
@@ -84,13 +118,16 @@ class RestaurantAPIClient:
         return response is not None
     
     # Table operations
-    def get_tables(self, restaurant_id: str, section_id: Optional[str] = None, status: Optional[str] = None) -> List[Dict]:
+    def get_tables(self, restaurant_id: str, section_id: Optional[str] = None, status: Optional[str] = None,
+                   min_capacity: Optional[int] = None) -> List[Dict]:
         """Get tables for a restaurant"""
         params = {}
         if section_id:
             params["section_id"] = section_id
         if status:
             params["status"] = status
+        if min_capacity:
+            params["min_capacity"] = min_capacity
         return self._make_request("GET", f"/restaurants/{restaurant_id}/tables", params=params)
     
     def create_table(self, restaurant_id: str, table_data: Dict) -> Optional[Dict]:
@@ -177,7 +214,7 @@ class RestaurantAPIClient:
     
     # Waiting list operations
     def get_waiting_list(self, restaurant_id: Optional[str] = None, status: Optional[str] = None) -> List[Dict]:
-        """Get waiting list entries"""
+        """Get waiting list entries, ordered by request time (oldest first)"""
         params = {}
         if restaurant_id:
             params["restaurant_id"] = restaurant_id
@@ -198,9 +235,20 @@ class RestaurantAPIClient:
         response = self._make_request("DELETE", f"/waiting-list/{waiting_list_id}")
         return response is not None
     
+    def seat_waiting_party(self, waiting_list_id: str, table_id: str, server_id: str,
+                           notes: Optional[str] = None) -> Optional[Dict]:
+        """Seat a waiting list party at a table in one request"""
+        data = {
+            "table_id": table_id,
+            "server_id": server_id
+        }
+        if notes:
+            data["notes"] = notes
+        return self._make_request("POST", f"/waiting-list/{waiting_list_id}/seat", data=data)
+    
     def get_next_waiting_party(self, restaurant_id: str) -> Optional[Dict]:
         """Get next party from waiting list"""
-        return self._make_request("GET", f"/restaurants/{restaurant_id}/waiting-list/next")
+        return self._make_request("GET", f"/waiting-list/restaurants/{restaurant_id}/next")
     
     # Table assignment operations
     def assign_table_to_party(self, restaurant_id: str, table_id: str, party_id: str, 
@@ -239,3 +287,29 @@ class RestaurantAPIClient:
         if end_date:
             params["end_date"] = end_date.isoformat()
         return self._make_request("GET", f"/restaurants/{restaurant_id}/analytics/occupancy", params=params)
+    
+    # Batch operations
+    def batch(self, batch_requests: List[Dict]) -> List[Optional[Any]]:
+        """Run several API requests in one round-trip, returning bodies in request order"""
+        payload = {"requests": [dict(item, id=i) for i, item in enumerate(batch_requests)]}
+        response = self._make_request("POST", "/batch/", data=payload)
+        
+        results = [None] * len(batch_requests)
+        for item in response.get("responses", []):
+            if 200 <= item["status_code"] < 300:
+                results[item["id"]] = item["body"]
+        return results
+    
+    def batch_fetch_seat_context(self, restaurant_id: str) -> Tuple[Optional[Dict], List[Dict]]:
+        """Get next waiting party and active servers in one request"""
+        next_party, servers = self.batch([
+            {"method": "GET", "url": f"/waiting-list/restaurants/{restaurant_id}/next"},
+            {"method": "GET", "url": "/servers/?" + urlencode({"restaurant_id": restaurant_id, "is_active": "true"})},
+        ])
+        return next_party, servers or []
+
+
+@st.cache_resource
+def get_api_client() -> RestaurantAPIClient:
+    """Shared API client, so its pooled HTTP session survives reruns"""
+    return RestaurantAPIClient()
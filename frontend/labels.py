@@ -0,0 +1,38 @@
+"""
+Option label helpers for the Streamlit pages
+Formats the labels shown by the selectboxes via format_func
+"""
+
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict
+
+_restaurant_fields = itemgetter('name', 'id')
+_table_fields = itemgetter('table_number', 'location', 'capacity')
+_server_fields = itemgetter('first_name', 'last_name', 'employee_id')
+_party_fields = itemgetter('name', 'size')
+
+
+def restaurant_label(restaurant: Dict) -> str:
+    """Label for a restaurant option"""
+    return "%s (%s)" % _restaurant_fields(restaurant)
+
+
+def table_label(table: Dict) -> str:
+    """Label for a table option"""
+    return "Table %s - %s (Capacity: %s)" % _table_fields(table)
+
+
+def server_label(server: Dict) -> str:
+    """Label for a server option"""
+    return "%s %s (%s)" % _server_fields(server)
+
+
+def party_label(party: Dict) -> str:
+    """Label for a party option"""
+    return "%s - Party of %s" % _party_fields(party)
+
+
+def format_timestamp(value: str) -> str:
+    """Format an ISO-8601 timestamp from the API as 'YYYY-MM-DD HH:MM'"""
+    return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M")
@@ -3,21 +3,17 @@ Configuration page for setting up restaurants, sections, tables, and servers
 """
 
 import streamlit as st
-import sys
-import os
 from datetime import datetime, date, timedelta
 
-# Add the parent directory to the path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from api_client import RestaurantAPIClient
+from api_client import get_api_client
+import labels
 
 def show():
     """Display the configuration page"""
     st.markdown('<h1 class="main-header">System Configuration</h1>', unsafe_allow_html=True)
     
     # Initialize API client
-    api_client = RestaurantAPIClient()
+    api_client = get_api_client()
     
     # Tabs for different configuration areas
     tab1, tab2, tab3, tab4 = st.tabs(["Restaurants", "Sections", "Tables", "Servers"])
@@ -121,9 +117,9 @@ def show_section_configuration(api_client):
         return
     
     # Restaurant selector
-    restaurant_options = {f"{r['name']} ({r['id']})": r['id'] for r in restaurants}
-    selected_restaurant_name = st.selectbox("Select Restaurant:", list(restaurant_options.keys()))
-    selected_restaurant_id = restaurant_options[selected_restaurant_name]
+    restaurants_by_id = {r['id']: r for r in restaurants}
+    selected_restaurant_id = st.selectbox("Select Restaurant:", list(restaurants_by_id),
+                                          format_func=lambda i: labels.restaurant_label(restaurants_by_id[i]))
     
     if not selected_restaurant_id:
         return
@@ -207,9 +203,9 @@ def show_table_configuration(api_client):
         return
     
     # Restaurant selector
-    restaurant_options = {f"{r['name']} ({r['id']})": r['id'] for r in restaurants}
-    selected_restaurant_name = st.selectbox("Select Restaurant:", list(restaurant_options.keys()))
-    selected_restaurant_id = restaurant_options[selected_restaurant_name]
+    restaurants_by_id = {r['id']: r for r in restaurants}
+    selected_restaurant_id = st.selectbox("Select Restaurant:", list(restaurants_by_id),
+                                          format_func=lambda i: labels.restaurant_label(restaurants_by_id[i]))
     
     if not selected_restaurant_id:
         return
@@ -309,9 +305,9 @@ def show_server_configuration(api_client):
         return
     
     # Restaurant selector
-    restaurant_options = {f"{r['name']} ({r['id']})": r['id'] for r in restaurants}
-    selected_restaurant_name = st.selectbox("Select Restaurant:", list(restaurant_options.keys()))
-    selected_restaurant_id = restaurant_options[selected_restaurant_name]
+    restaurants_by_id = {r['id']: r for r in restaurants}
+    selected_restaurant_id = st.selectbox("Select Restaurant:", list(restaurants_by_id),
+                                          format_func=lambda i: labels.restaurant_label(restaurants_by_id[i]))
     
     if not selected_restaurant_id:
         return
@@ -4,21 +4,17 @@ Shows overview metrics and current status
 """
 
 import streamlit as st
-import sys
-import os
 from datetime import datetime, date, timedelta
 
-# Add the parent directory to the path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from api_client import RestaurantAPIClient
+from api_client import get_api_client
+import labels
 
 def show():
     """Display the dashboard page"""
     st.markdown('<h1 class="main-header">Restaurant Dashboard</h1>', unsafe_allow_html=True)
     
     # Initialize API client
-    api_client = RestaurantAPIClient()
+    api_client = get_api_client()
     
     # Get restaurants
     restaurants = api_client.get_restaurants()
@@ -28,9 +24,9 @@ def show():
         return
     
     # Restaurant selector
-    restaurant_options = {f"{r['name']} ({r['id']})": r['id'] for r in restaurants}
-    selected_restaurant_name = st.selectbox("Select Restaurant:", list(restaurant_options.keys()))
-    selected_restaurant_id = restaurant_options[selected_restaurant_name]
+    restaurants_by_id = {r['id']: r for r in restaurants}
+    selected_restaurant_id = st.selectbox("Select Restaurant:", list(restaurants_by_id),
+                                          format_func=lambda i: labels.restaurant_label(restaurants_by_id[i]))
     
     if not selected_restaurant_id:
         return
@@ -62,8 +58,6 @@ def show():
     tables = api_client.get_tables(selected_restaurant_id)
     reservations = api_client.get_reservations(restaurant_id=selected_restaurant_id, 
                                              date_filter=date.today())
-    waiting_list = api_client.get_waiting_list(restaurant_id=selected_restaurant_id, 
-                                             status="WAITING")
     
     # Calculate metrics
     total_tables = len(tables)
@@ -72,7 +66,6 @@ def show():
     reserved_tables = len([t for t in tables if t['status'] == 'RESERVED'])
     
     today_reservations = len([r for r in reservations if r['status'] == 'CONFIRMED'])
-    waiting_parties = len(waiting_list)
     
     # Display metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -87,7 +80,6 @@ def show():
     
     with col3:
         st.metric("Today's Reservations", today_reservations)
-        st.metric("Waiting Parties", waiting_parties)
     
     with col4:
         occupancy_rate = (occupied_tables / total_tables * 100) if total_tables > 0 else 0
@@ -131,20 +123,26 @@ def show():
     else:
         st.info("No reservations for today")
     
-    # Waiting list
-    if waiting_parties > 0:
-        st.subheader("Current Waiting List")
-        
-        waiting_data = []
-        for party in waiting_list[:10]:  # Show only first 10
-            waiting_data.append({
-                "Customer": party['customer_name'],
-                "Party Size": party['party_size'],
-                "Wait Time": f"{party.get('estimated_wait_time', 0)} min",
-                "Request Time": party['request_time'][:16]
-            })
-        
-        st.dataframe(waiting_data, use_container_width=True)
+    # Waiting list (only fetched once the user asks for it)
+    with st.expander("Current Waiting List", expanded=False):
+        if st.checkbox("Show waiting list", key="wl_expanded"):
+            waiting_list = api_client.get_waiting_list(restaurant_id=selected_restaurant_id, 
+                                                     status="WAITING")
+            st.metric("Waiting Parties", len(waiting_list))
+            
+            if waiting_list:
+                waiting_data = []
+                for party in waiting_list[:10]:  # Show only first 10
+                    waiting_data.append({
+                        "Customer": party['customer_name'],
+                        "Party Size": party['party_size'],
+                        "Wait Time": f"{party.get('estimated_wait_time', 0)} min",
+                        "Request Time": party['request_time'][:16]
+                    })
+                
+                st.dataframe(waiting_data, use_container_width=True)
+            else:
+                st.info("No parties currently on the waiting list")
     
     # Quick actions
     st.subheader("Quick Actions")
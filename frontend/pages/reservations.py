@@ -4,21 +4,17 @@ Allows adding, editing, and removing reservations
 """
 
 import streamlit as st
-import sys
-import os
 from datetime import datetime, date, timedelta
 
-# Add the parent directory to the path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from api_client import RestaurantAPIClient
+from api_client import get_api_client
+import labels
 
 def show():
     """Display the reservations management page"""
     st.markdown('<h1 class="main-header">Reservation Management</h1>', unsafe_allow_html=True)
     
     # Initialize API client
-    api_client = RestaurantAPIClient()
+    api_client = get_api_client()
     
     # Get restaurants
     restaurants = api_client.get_restaurants()
@@ -28,9 +24,9 @@ def show():
         return
     
     # Restaurant selector
-    restaurant_options = {f"{r['name']} ({r['id']})": r['id'] for r in restaurants}
-    selected_restaurant_name = st.selectbox("Select Restaurant:", list(restaurant_options.keys()))
-    selected_restaurant_id = restaurant_options[selected_restaurant_name]
+    restaurants_by_id = {r['id']: r for r in restaurants}
+    selected_restaurant_id = st.selectbox("Select Restaurant:", list(restaurants_by_id),
+                                          format_func=lambda i: labels.restaurant_label(restaurants_by_id[i]))
     
     if not selected_restaurant_id:
         return
@@ -4,21 +4,19 @@ Allows assigning tables to parties and managing current assignments
 """
 
 import streamlit as st
-import sys
-import os
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 
-# Add the parent directory to the path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from api_client import RestaurantAPIClient
+from api_client import get_api_client
+import labels
 
 def show():
     """Display the table assignment page"""
     st.markdown('<h1 class="main-header">Table Assignment</h1>', unsafe_allow_html=True)
     
     # Initialize API client
-    api_client = RestaurantAPIClient()
+    api_client = get_api_client()
     
     # Get restaurants
     restaurants = api_client.get_restaurants()
@@ -28,9 +26,9 @@ def show():
         return
     
     # Restaurant selector
-    restaurant_options = {f"{r['name']} ({r['id']})": r['id'] for r in restaurants}
-    selected_restaurant_name = st.selectbox("Select Restaurant:", list(restaurant_options.keys()))
-    selected_restaurant_id = restaurant_options[selected_restaurant_name]
+    restaurants_by_id = {r['id']: r for r in restaurants}
+    selected_restaurant_id = st.selectbox("Select Restaurant:", list(restaurants_by_id),
+                                          format_func=lambda i: labels.restaurant_label(restaurants_by_id[i]))
     
     if not selected_restaurant_id:
         return
@@ -101,23 +99,25 @@ def show_assign_table_form(api_client, restaurant_id):
     """Display form to assign table to party"""
     st.subheader("Assign Table to Party")
     
-    # Get available tables
-    tables = api_client.get_tables(restaurant_id=restaurant_id, status="AVAILABLE")
+    # Available tables, waiting parties and active servers are independent lookups,
+    # so fetch them concurrently (worker threads share the script context for st.error)
+    with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx,
+                            initargs=(None, get_script_run_ctx())) as executor:
+        tables_future = executor.submit(api_client.get_tables, restaurant_id=restaurant_id, status="AVAILABLE")
+        parties_future = executor.submit(api_client.get_parties, status="WAITING")
+        servers_future = executor.submit(api_client.get_servers, restaurant_id=restaurant_id, is_active=True)
+    tables = tables_future.result()
+    parties = parties_future.result()
+    servers = servers_future.result()
     
     if not tables:
         st.warning("No available tables found")
         return
     
-    # Get parties waiting to be seated
-    parties = api_client.get_parties(status="WAITING")
-    
     if not parties:
         st.warning("No parties waiting to be seated")
         return
     
-    # Get servers
-    servers = api_client.get_servers(restaurant_id=restaurant_id, is_active=True)
-    
     if not servers:
         st.warning("No active servers found")
         return
@@ -127,22 +127,20 @@ def show_assign_table_form(api_client, restaurant_id):
         
         with col1:
             # Table selection
-            table_options = {f"Table {t['table_number']} - {t['location']} (Capacity: {t['capacity']})": t['id'] 
-                           for t in tables}
-            selected_table_name = st.selectbox("Select Table *", list(table_options.keys()))
-            selected_table_id = table_options[selected_table_name]
+            tables_by_id = {t['id']: t for t in tables}
+            selected_table_id = st.selectbox("Select Table *", list(tables_by_id),
+                                             format_func=lambda i: labels.table_label(tables_by_id[i]))
             
             # Server selection
-            server_options = {f"{s['first_name']} {s['last_name']} ({s['employee_id']})": s['id'] 
-                            for s in servers}
-            selected_server_name = st.selectbox("Select Server *", list(server_options.keys()))
-            selected_server_id = server_options[selected_server_name]
+            servers_by_id = {s['id']: s for s in servers}
+            selected_server_id = st.selectbox("Select Server *", list(servers_by_id),
+                                              format_func=lambda i: labels.server_label(servers_by_id[i]))
         
         with col2:
             # Party selection
-            party_options = {f"{p['name']} - Party of {p['size']}": p['id'] for p in parties}
-            selected_party_name = st.selectbox("Select Party *", list(party_options.keys()))
-            selected_party_id = party_options[selected_party_name]
+            parties_by_id = {p['id']: p for p in parties}
+            selected_party_id = st.selectbox("Select Party *", list(parties_by_id),
+                                             format_func=lambda i: labels.party_label(parties_by_id[i]))
             
             # Notes
             notes = st.text_area("Assignment Notes", placeholder="Any special notes for this assignment")
@@ -4,33 +4,45 @@ Allows managing the waiting list and seating parties when tables become availabl
 """
 
 import streamlit as st
-import sys
-import os
 from datetime import datetime, date, timedelta
 
-# Add the parent directory to the path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from api_client import get_api_client
+import labels
 
-from api_client import RestaurantAPIClient
+@st.cache_data(ttl=60)
+def _cached_restaurants():
+    """Fetch the restaurant list, reused across reruns for up to a minute"""
+    return get_api_client().get_restaurants()
+
+@st.cache_data(ttl=10)
+def _fetch_waiting_list(restaurant_id, status):
+    """Fetch waiting list entries, cached per (restaurant, status) for a few seconds"""
+    waiting_list = get_api_client().get_waiting_list(restaurant_id=restaurant_id, status=status)
+    # Format timestamps once per fetch rather than on every rerun; build new dicts, since the
+    # client hands back the bodies it keeps in its shared ETag cache
+    return [{**entry, '_request_time_fmt': labels.format_timestamp(entry['request_time'])}
+            for entry in waiting_list]
 
 def show():
     """Display the waiting list management page"""
     st.markdown('<h1 class="main-header">Waiting List Management</h1>', unsafe_allow_html=True)
     
     # Initialize API client
-    api_client = RestaurantAPIClient()
+    api_client = get_api_client()
     
     # Get restaurants
-    restaurants = api_client.get_restaurants()
+    if st.button("Refresh"):
+        _cached_restaurants.clear()
+    restaurants = _cached_restaurants()
     
     if not restaurants:
         st.warning("No restaurants found. Please configure a restaurant first.")
         return
     
     # Restaurant selector
-    restaurant_options = {f"{r['name']} ({r['id']})": r['id'] for r in restaurants}
-    selected_restaurant_name = st.selectbox("Select Restaurant:", list(restaurant_options.keys()))
-    selected_restaurant_id = restaurant_options[selected_restaurant_name]
+    restaurants_by_id = {r['id']: r for r in restaurants}
+    selected_restaurant_id = st.selectbox("Select Restaurant:", list(restaurants_by_id),
+                                          format_func=lambda i: labels.restaurant_label(restaurants_by_id[i]))
     
     if not selected_restaurant_id:
         return
@@ -47,78 +59,147 @@ def show():
     with tab3:
         show_seat_next_party(api_client, selected_restaurant_id)
 
+@st.fragment
+def _entry_actions(api_client, restaurant_id, entry):
+    """Action buttons for one waiting list entry; they and the forms they open rerun on their own"""
+    entry_id = entry['id']
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("Seat Now", key="seat_selected"):
+            st.session_state.entry_action = ("seat", entry_id)
+    
+    with col2:
+        if st.button("Update Wait Time", key="update_selected"):
+            st.session_state.entry_action = ("update", entry_id)
+    
+    with col3:
+        if st.button("Remove", key="remove_selected"):
+            if api_client.remove_from_waiting_list(entry_id):
+                st.success("Party removed from waiting list")
+                _fetch_waiting_list.clear()
+                # The list itself changed, so rerun the whole page
+                st.rerun(scope="app")
+            else:
+                st.error("Failed to remove party from waiting list")
+    
+    # The open form belongs to the entry it was opened for
+    action = st.session_state.get("entry_action")
+    if action == ("seat", entry_id):
+        _seat_entry_form(api_client, restaurant_id, entry)
+    elif action == ("update", entry_id):
+        _update_wait_time_form(api_client, entry)
+
+def _seat_entry_form(api_client, restaurant_id, entry):
+    """Form seating the selected entry at an available table"""
+    suitable_tables = api_client.get_tables(restaurant_id=restaurant_id, status="AVAILABLE",
+                                            min_capacity=entry['party_size'])
+    servers = api_client.get_servers(restaurant_id=restaurant_id, is_active=True)
+    
+    if not suitable_tables:
+        st.warning(f"No tables available for party size {entry['party_size']}")
+        return
+    
+    if not servers:
+        st.warning("No active servers found")
+        return
+    
+    with st.form("seat_selected_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            tables_by_id = {t['id']: t for t in suitable_tables}
+            table_id = st.selectbox("Select Table *", list(tables_by_id),
+                                    format_func=lambda i: labels.table_label(tables_by_id[i]))
+        
+        with col2:
+            servers_by_id = {s['id']: s for s in servers}
+            server_id = st.selectbox("Select Server *", list(servers_by_id),
+                                     format_func=lambda i: labels.server_label(servers_by_id[i]))
+        
+        if st.form_submit_button("Seat Party", use_container_width=True):
+            if api_client.seat_waiting_party(waiting_list_id=entry['id'], table_id=table_id,
+                                             server_id=server_id):
+                st.session_state.pop("entry_action", None)
+                _fetch_waiting_list.clear()
+                st.rerun(scope="app")
+            else:
+                st.error("Failed to seat party. Please try again.")
+
+def _update_wait_time_form(api_client, entry):
+    """Form changing the selected entry's estimated wait time"""
+    with st.form("update_wait_time_form"):
+        estimated_wait_time = st.number_input("Estimated Wait Time (minutes)", min_value=0, max_value=300,
+                                              value=entry.get('estimated_wait_time') or 0)
+        
+        if st.form_submit_button("Update Wait Time", use_container_width=True):
+            if api_client.update_waiting_list_entry(entry['id'],
+                                                    {"estimated_wait_time": estimated_wait_time}):
+                st.session_state.pop("entry_action", None)
+                _fetch_waiting_list.clear()
+                st.rerun(scope="app")
+            else:
+                st.error("Failed to update wait time")
+
 def show_waiting_list(api_client, restaurant_id):
     """Display current waiting list"""
     st.subheader("Current Waiting List")
     
     # Get waiting list entries
-    waiting_list = api_client.get_waiting_list(restaurant_id=restaurant_id, status="WAITING")
+    waiting_list = _fetch_waiting_list(restaurant_id, "WAITING")
     
     if not waiting_list:
         st.info("No parties currently on the waiting list")
         return
     
-    # Sort by request time (oldest first)
-    waiting_list.sort(key=lambda x: x['request_time'])
-    
-    # Display waiting list
+    # Summary metrics in a single pass
+    total_waiting = len(waiting_list)
+    total_wait = 0
+    longest_wait = 0
+    for entry in waiting_list:
+        wait = entry.get('estimated_wait_time') or 0
+        total_wait += wait
+        if wait > longest_wait:
+            longest_wait = wait
+    avg_wait = total_wait / total_waiting if total_waiting else 0
+    
+    # Display waiting list (the API already returns it oldest first)
+    waiting_data = []
     for i, entry in enumerate(waiting_list):
-        with st.expander(f"#{i+1} - {entry['customer_name']} - Party of {entry['party_size']}"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write(f"**Customer:** {entry['customer_name']}")
-                st.write(f"**Phone:** {entry['customer_phone']}")
-                st.write(f"**Party Size:** {entry['party_size']}")
-                st.write(f"**Request Time:** {entry['request_time'][:16]}")
-            
-            with col2:
-                st.write(f"**Estimated Wait:** {entry.get('estimated_wait_time', 0)} minutes")
-                st.write(f"**Status:** {entry['status']}")
-                if entry.get('notes'):
-                    st.write(f"**Notes:** {entry['notes']}")
-            
-            # Action buttons
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                if st.button(f"Seat Now", key=f"seat_{entry['id']}"):
-                    st.session_state.seat_party_id = entry['id']
-                    st.rerun()
-            
-            with col2:
-                if st.button(f"Update Wait Time", key=f"update_{entry['id']}"):
-                    st.session_state.update_wait_id = entry['id']
-                    st.rerun()
-            
-            with col3:
-                if st.button(f"Remove", key=f"remove_{entry['id']}"):
-                    if api_client.remove_from_waiting_list(entry['id']):
-                        st.success("Party removed from waiting list")
-                        st.rerun()
-                    else:
-                        st.error("Failed to remove party from waiting list")
+        waiting_data.append({
+            "#": i + 1,
+            "Customer": entry['customer_name'],
+            "Phone": entry['customer_phone'],
+            "Party Size": entry['party_size'],
+            "Request Time": entry['_request_time_fmt'],
+            "Estimated Wait": f"{entry.get('estimated_wait_time') or 0} min",
+            "Status": entry['status'],
+            "Notes": entry.get('notes') or ""
+        })
+    
+    st.dataframe(waiting_data, use_container_width=True, hide_index=True)
+    
+    # Actions for the selected entry only
+    entries_by_id = {entry['id']: entry for entry in waiting_list}
+    selected_entry_id = st.selectbox(
+        "Select Party:", list(entries_by_id),
+        format_func=lambda i: f"{entries_by_id[i]['customer_name']} - Party of {entries_by_id[i]['party_size']}"
+    )
+    
+    _entry_actions(api_client, restaurant_id, entries_by_id[selected_entry_id])
     
     # Summary statistics
     st.markdown("---")
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Total Waiting", len(waiting_list))
+        st.metric("Total Waiting", total_waiting)
     
     with col2:
-        if waiting_list:
-            avg_wait = sum(entry.get('estimated_wait_time', 0) for entry in waiting_list) / len(waiting_list)
-            st.metric("Average Wait Time", f"{avg_wait:.0f} min")
-        else:
-            st.metric("Average Wait Time", "0 min")
+        st.metric("Average Wait Time", f"{avg_wait:.0f} min")
     
     with col3:
-        if waiting_list:
-            longest_wait = max(entry.get('estimated_wait_time', 0) for entry in waiting_list)
-            st.metric("Longest Wait", f"{longest_wait} min")
-        else:
-            st.metric("Longest Wait", "0 min")
+        st.metric("Longest Wait", f"{longest_wait} min")
 
 def show_add_to_waiting_list_form(api_client, restaurant_id):
     """Display form to add party to waiting list"""
@@ -140,7 +221,7 @@ def show_add_to_waiting_list_form(api_client, restaurant_id):
         submitted = st.form_submit_button("Add to Waiting List", use_container_width=True)
         
         if submitted:
-            if not all([customer_name, customer_phone, party_size]):
+            if not customer_name or not customer_phone:
                 st.error("Please fill in all required fields (marked with *)")
             else:
                 waiting_list_data = {
@@ -155,6 +236,7 @@ def show_add_to_waiting_list_form(api_client, restaurant_id):
                 result = api_client.add_to_waiting_list(waiting_list_data)
                 if result:
                     st.success("Party added to waiting list successfully!")
+                    _fetch_waiting_list.clear()
                     st.rerun()
                 else:
                     st.error("Failed to add party to waiting list. Please check the details and try again.")
@@ -163,8 +245,8 @@ def show_seat_next_party(api_client, restaurant_id):
     """Display interface to seat the next party from waiting list"""
     st.subheader("Seat Next Party")
     
-    # Get next party from waiting list
-    next_party = api_client.get_next_waiting_party(restaurant_id)
+    # Get next party and servers in a single round-trip
+    next_party, servers = api_client.batch_fetch_seat_context(restaurant_id)
     
     if not next_party:
         st.info("No parties currently on the waiting list")
@@ -179,7 +261,7 @@ def show_seat_next_party(api_client, restaurant_id):
         st.write(f"**Customer:** {next_party['customer_name']}")
         st.write(f"**Phone:** {next_party['customer_phone']}")
         st.write(f"**Party Size:** {next_party['party_size']}")
-        st.write(f"**Request Time:** {next_party['request_time'][:16]}")
+        st.write(f"**Request Time:** {labels.format_timestamp(next_party['request_time'])}")
     
     with col2:
         st.write(f"**Estimated Wait:** {next_party.get('estimated_wait_time', 0)} minutes")
@@ -189,23 +271,14 @@ def show_seat_next_party(api_client, restaurant_id):
     
     st.markdown("---")
     
-    # Get available tables
-    available_tables = api_client.get_tables(restaurant_id=restaurant_id, status="AVAILABLE")
-    
-    if not available_tables:
-        st.warning("No available tables found. Cannot seat party at this time.")
-        return
-    
-    # Filter tables by capacity
-    suitable_tables = [t for t in available_tables if t['capacity'] >= next_party['party_size']]
+    # Get available tables large enough for the party
+    suitable_tables = api_client.get_tables(restaurant_id=restaurant_id, status="AVAILABLE",
+                                            min_capacity=next_party['party_size'])
     
     if not suitable_tables:
         st.warning(f"No tables available for party size {next_party['party_size']}")
         return
     
-    # Get servers
-    servers = api_client.get_servers(restaurant_id=restaurant_id, is_active=True)
-    
     if not servers:
         st.warning("No active servers found")
         return
@@ -216,17 +289,15 @@ def show_seat_next_party(api_client, restaurant_id):
         
         with col1:
             # Table selection
-            table_options = {f"Table {t['table_number']} - {t['location']} (Capacity: {t['capacity']})": t['id'] 
-                           for t in suitable_tables}
-            selected_table_name = st.selectbox("Select Table *", list(table_options.keys()))
-            selected_table_id = table_options[selected_table_name]
+            tables_by_id = {t['id']: t for t in suitable_tables}
+            selected_table_id = st.selectbox("Select Table *", list(tables_by_id),
+                                             format_func=lambda i: labels.table_label(tables_by_id[i]))
         
         with col2:
             # Server selection
-            server_options = {f"{s['first_name']} {s['last_name']} ({s['employee_id']})": s['id'] 
-                            for s in servers}
-            selected_server_name = st.selectbox("Select Server *", list(server_options.keys()))
-            selected_server_id = server_options[selected_server_name]
+            servers_by_id = {s['id']: s for s in servers}
+            selected_server_id = st.selectbox("Select Server *", list(servers_by_id),
+                                              format_func=lambda i: labels.server_label(servers_by_id[i]))
         
         # Notes
         notes = st.text_area("Assignment Notes", placeholder="Any special notes for this assignment")
@@ -234,35 +305,20 @@ def show_seat_next_party(api_client, restaurant_id):
         submitted = st.form_submit_button("Seat Party", use_container_width=True)
         
         if submitted:
-            if not all([selected_table_id, selected_server_id]):
+            if not selected_table_id or not selected_server_id:
                 st.error("Please select table and server")
             else:
-                # First create a party from the waiting list entry
-                party_data = {
-                    "name": next_party['customer_name'],
-                    "size": next_party['party_size'],
-                    "phone": next_party['customer_phone'],
-                    "status": "WAITING"
-                }
-                
-                party_result = api_client.create_party(party_data)
-                if not party_result:
-                    st.error("Failed to create party")
-                    return
-                
-                # Then assign the table
-                assignment_result = api_client.assign_table_to_party(
-                    restaurant_id=restaurant_id,
+                # Party creation, table assignment and status update happen in one transaction
+                assignment_result = api_client.seat_waiting_party(
+                    waiting_list_id=next_party['id'],
                     table_id=selected_table_id,
-                    party_id=party_result['id'],
                     server_id=selected_server_id,
                     notes=notes if notes else None
                 )
                 
                 if assignment_result:
-                    # Update waiting list entry status
-                    api_client.update_waiting_list_entry(next_party['id'], {"status": "SEATED"})
                     st.success("Party seated successfully!")
+                    _fetch_waiting_list.clear()
                     st.rerun()
                 else:
                     st.error("Failed to seat party. Please try again.")
@@ -4,19 +4,16 @@ Main application entry point
 """
 
 import streamlit as st
-import sys
-import os
+import importlib
 
-# Add the parent directory to the path to import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from pages import (
-    dashboard,
-    reservations,
-    table_assignment,
-    waiting_list,
-    configuration
-)
+# Navigation label -> page module, imported only when selected
+PAGES = {
+    "Dashboard": "dashboard",
+    "Reservations": "reservations",
+    "Table Assignment": "table_assignment",
+    "Waiting List": "waiting_list",
+    "Configuration": "configuration"
+}
 
 # Page configuration
 st.set_page_config(
@@ -67,28 +64,11 @@ def main():
     st.sidebar.markdown("---")
     
     # Navigation menu
-    page = st.sidebar.selectbox(
-        "Navigate to:",
-        [
-            "Dashboard",
-            "Reservations",
-            "Table Assignment", 
-            "Waiting List",
-            "Configuration"
-        ]
-    )
+    page = st.sidebar.selectbox("Navigate to:", list(PAGES))
     
     # Display selected page
-    if page == "Dashboard":
-        dashboard.show()
-    elif page == "Reservations":
-        reservations.show()
-    elif page == "Table Assignment":
-        table_assignment.show()
-    elif page == "Waiting List":
-        waiting_list.show()
-    elif page == "Configuration":
-        configuration.show()
+    module = importlib.import_module(f"pages.{PAGES[page]}")
+    module.show()
 
 if __name__ == "__main__":
     main()
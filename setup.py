@@ -13,6 +13,7 @@ setup(
         "pydantic==2.5.0",
         "pydantic-settings==2.1.0",
         "email-validator==2.1.0",
+        "orjson==3.9.10",
         "sqlalchemy==2.0.23",
         "alembic==1.13.1",
         "pymysql==1.1.0",
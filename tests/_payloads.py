@@ -0,0 +1,67 @@
+"""
+Valid payloads, identifiers and timestamps shared by the schema and service tests
+"""
+from datetime import datetime
+
+# Timestamps shared by the test payloads
+SEATING_TIME = datetime(2025, 10, 20, 19, 0, 0)
+NEXT_DAY_SEATING_TIME = datetime(2025, 10, 21, 20, 0, 0)
+CREATED_AT = datetime(2025, 10, 20, 10, 0, 0)
+
+# Identifiers shared by the schema validation payloads
+RESTAURANT_ID = "123e4567-e89b-12d3-a456-426614174000"
+PARTY_ID = "123e4567-e89b-12d3-a456-426614174001"
+TABLE_ID = "123e4567-e89b-12d3-a456-426614174002"
+SERVER_ID = "123e4567-e89b-12d3-a456-426614174003"
+
+# Valid create payloads; tests override single fields with `PAYLOAD | {...}`
+RESTAURANT_PAYLOAD = {
+    "name": "Test Restaurant",
+    "address": "123 Test St",
+    "phone": "+1-555-0123",
+    "opening_time": "09:00:00",
+    "closing_time": "22:00:00",
+    "max_capacity": 100
+}
+TABLE_PAYLOAD = {
+    "restaurant_id": RESTAURANT_ID,
+    "table_number": "T-01",
+    "capacity": 4,
+    "location": "Near window",
+    "status": "AVAILABLE"
+}
+PARTY_PAYLOAD = {
+    "name": "Test Party",
+    "phone": "+1-555-0123",
+    "email": "test@example.com",
+    "size": 4,
+    "status": "WAITING"
+}
+RESERVATION_PAYLOAD = {
+    "restaurant_id": RESTAURANT_ID,
+    "party_id": PARTY_ID,
+    "reservation_time": SEATING_TIME,
+    "party_size": 4,
+    "customer_name": "Test Customer",
+    "customer_phone": "+1-555-0123",
+    "customer_email": "test@example.com",
+    "status": "CONFIRMED",
+    "special_requests": "Window table"
+}
+SERVER_PAYLOAD = {
+    "restaurant_id": RESTAURANT_ID,
+    "first_name": "John",
+    "last_name": "Server",
+    "employee_id": "EMP001",
+    "phone": "+1-555-0199",
+    "email": "john@test.com",
+    "is_active": True
+}
+TABLE_ASSIGNMENT_PAYLOAD = {
+    "restaurant_id": RESTAURANT_ID,
+    "table_id": TABLE_ID,
+    "party_id": PARTY_ID,
+    "server_id": SERVER_ID,
+    "assigned_at": SEATING_TIME
+}
+
@@ -2,31 +2,66 @@
 Pytest configuration and shared fixtures
 """
 import pytest
+import pytest_asyncio
 import asyncio
+import httpx
+from dataclasses import dataclass
 from typing import Generator, AsyncGenerator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, insert, inspect
+from sqlalchemy.orm import sessionmaker, Session, make_transient, make_transient_to_detached
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
-from datetime import datetime, date, time
-import uuid
 
 # Import app modules (PYTHONPATH should be set to include backend/)
 from app.main import app
+from app.core.config import settings
 from app.database.connection import get_db, Base
 from app.models.database import (
     Restaurant, Section, Table, Party, Reservation, 
-    WaitingList, Server, TableAssignment, ReservationAssignment
+    Server, TableAssignment, generate_uuid
 )
+from app.models.schemas import TableAssignmentCreate
+from app.services.assignment_service import AssignmentService
+from app.services.restaurant_service import table_cache
+from tests._payloads import SEATING_TIME
 
 # Test database URL (in-memory SQLite for testing)
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
-# Create test engine
+# Create test engine; StaticPool hands every checkout the same in-memory connection
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
 )
 
+
+# Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# Test data is throwaway; skip fsyncs and keep journals and temp tables in memory
+@event.listens_for(engine, "connect")
+def _fast_sqlite(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+# Fail tests on accidental relationship lazy loads from list queries
+settings.raise_on_lazy_load = True
+
+# The result cache is off by default; turn it on so the suite exercises it
+table_cache.ttl = 30
+
 # Create test session
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -39,51 +74,103 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture(scope="function")
-def db_session() -> Generator[Session, None, None]:
-    """Create a fresh database session for each test."""
-    # Create all tables
+@pytest.fixture(scope="session")
+def _schema():
+    """Create the schema once for the whole test session, on first use by a database fixture."""
     Base.metadata.create_all(bind=engine)
-    
-    # Create session
-    session = TestingSessionLocal()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="session")
+def _shared_session(_schema) -> Generator[Session, None, None]:
+    """Create a database session shared by the whole test run and rolled back when it finishes."""
+    # Run every test inside one outer transaction; commits only release SAVEPOINTs
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     
     try:
         yield session
     finally:
         session.close()
-        # Drop all tables after test
-        Base.metadata.drop_all(bind=engine)
-        # Recreate tables for next test
-        Base.metadata.create_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="function")
+def db_session(_shared_session: Session) -> Generator[Session, None, None]:
+    """Provide the shared session with this test's changes rolled back afterwards."""
+    session = _shared_session
+    # End any transaction a fixture left open so the SAVEPOINT below is the outermost one
+    session.commit()
+    savepoint = session.bind.begin_nested()
+    loaded = list(session.identity_map.values())
+    
+    try:
+        yield session
+    finally:
+        session.rollback()
+        savepoint.rollback()
+        # Objects deleted by the test exist again after the rollback; reattach them
+        deleted = [obj for obj in loaded if inspect(obj).deleted or inspect(obj).detached]
+        for obj in deleted:
+            make_transient(obj)
+            make_transient_to_detached(obj)
+        session.add_all(deleted)
+        session.expire_all()
+        # Results cached from this test's rolled-back rows must not leak into the next test
+        table_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def _test_client() -> Generator[TestClient, None, None]:
+    """Start the app and its TestClient once for the whole test session."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db_session: Session) -> Generator[TestClient, None, None]:
-    """Create a test client with database dependency override."""
+def _db_override(db_session: Session) -> Generator[None, None, None]:
+    """Bind the app's database dependency to this test's session."""
     def override_get_db():
         try:
             yield db_session
         finally:
             pass
     
-    # Override the database dependency
     app.dependency_overrides[get_db] = override_get_db
     
-    # Also override the database URL in settings for the app
-    from app.core.config import settings
-    original_db_url = settings.database_url
-    settings.database_url = SQLALCHEMY_DATABASE_URL
+    yield
     
-    with TestClient(app) as test_client:
-        yield test_client
-    
-    # Restore original settings
-    settings.database_url = original_db_url
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="function")
+def client(_test_client: TestClient, _db_override) -> TestClient:
+    """Provide the shared test client with the database dependency bound to this test's session."""
+    return _test_client
+
+
+@pytest_asyncio.fixture
+async def async_client(_db_override) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create an async client that calls the app in-process, without TestClient's thread portal."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as test_client:
+        yield test_client
+
+
+@dataclass
+class SampleWorld:
+    """Linked sample rows shared by every test in the run."""
+    restaurant: Restaurant
+    section: Section
+    table: Table
+    party: Party
+    server: Server
+
+
+@pytest.fixture(scope="session")
 def sample_restaurant_data():
     """Sample restaurant data for testing."""
     return {
@@ -96,21 +183,10 @@ def sample_restaurant_data():
     }
 
 
-@pytest.fixture
-def sample_restaurant(db_session: Session, sample_restaurant_data):
-    """Create a sample restaurant in the database."""
-    restaurant = Restaurant(**sample_restaurant_data)
-    db_session.add(restaurant)
-    db_session.commit()
-    db_session.refresh(restaurant)
-    return restaurant
-
-
-@pytest.fixture
-def sample_section_data(sample_restaurant):
+@pytest.fixture(scope="session")
+def sample_section_data():
     """Sample section data for testing."""
     return {
-        "restaurant_id": sample_restaurant.id,
         "name": "Main Dining",
         "description": "Main dining area",
         "capacity": 50,
@@ -118,21 +194,10 @@ def sample_section_data(sample_restaurant):
     }
 
 
-@pytest.fixture
-def sample_section(db_session: Session, sample_section_data):
-    """Create a sample section in the database."""
-    section = Section(**sample_section_data)
-    db_session.add(section)
-    db_session.commit()
-    db_session.refresh(section)
-    return section
-
-
-@pytest.fixture
-def sample_table_data(sample_restaurant, sample_section):
+@pytest.fixture(scope="session")
+def sample_table_data():
     """Sample table data for testing."""
     return {
-        "restaurant_id": sample_restaurant.id,
         "table_number": "T-01",
         "capacity": 4,
         "location": "Near window",
@@ -141,17 +206,7 @@ def sample_table_data(sample_restaurant, sample_section):
     }
 
 
-@pytest.fixture
-def sample_table(db_session: Session, sample_table_data):
-    """Create a sample table in the database."""
-    table = Table(**sample_table_data)
-    db_session.add(table)
-    db_session.commit()
-    db_session.refresh(table)
-    return table
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_party_data():
     """Sample party data for testing."""
     return {
@@ -163,23 +218,79 @@ def sample_party_data():
     }
 
 
-@pytest.fixture
-def sample_party(db_session: Session, sample_party_data):
-    """Create a sample party in the database."""
-    party = Party(**sample_party_data)
-    db_session.add(party)
-    db_session.commit()
-    db_session.refresh(party)
-    return party
+@pytest.fixture(scope="session")
+def sample_server_data():
+    """Sample server data for testing."""
+    return {
+        "first_name": "John",
+        "last_name": "Server",
+        "employee_id": "EMP001",
+        "is_active": True
+    }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_world(_shared_session: Session, sample_restaurant_data, sample_section_data,
+                 sample_table_data, sample_party_data, sample_server_data) -> SampleWorld:
+    """Insert the sample restaurant, section, table, party and server in one commit."""
+    restaurant_id = generate_uuid()
+    rows = {
+        Restaurant: {**sample_restaurant_data, "id": restaurant_id},
+        Section: {**sample_section_data, "id": generate_uuid(), "restaurant_id": restaurant_id},
+        Table: {**sample_table_data, "id": generate_uuid(), "restaurant_id": restaurant_id},
+        Party: {**sample_party_data, "id": generate_uuid()},
+        Server: {**sample_server_data, "id": generate_uuid(), "restaurant_id": restaurant_id},
+    }
+    for model, row in rows.items():
+        _shared_session.execute(insert(model), [row])
+    _shared_session.commit()
+    
+    return SampleWorld(
+        restaurant=_shared_session.get(Restaurant, restaurant_id),
+        section=_shared_session.get(Section, rows[Section]["id"]),
+        table=_shared_session.get(Table, rows[Table]["id"]),
+        party=_shared_session.get(Party, rows[Party]["id"]),
+        server=_shared_session.get(Server, rows[Server]["id"]),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_restaurant(sample_world: SampleWorld) -> Restaurant:
+    """The sample restaurant from the shared sample rows."""
+    return sample_world.restaurant
+
+
+@pytest.fixture(scope="session")
+def sample_section(sample_world: SampleWorld) -> Section:
+    """The sample section from the shared sample rows."""
+    return sample_world.section
+
+
+@pytest.fixture(scope="session")
+def sample_table(sample_world: SampleWorld) -> Table:
+    """The sample table from the shared sample rows."""
+    return sample_world.table
+
+
+@pytest.fixture(scope="session")
+def sample_party(sample_world: SampleWorld) -> Party:
+    """The sample party from the shared sample rows."""
+    return sample_world.party
+
+
+@pytest.fixture(scope="session")
+def sample_server(sample_world: SampleWorld) -> Server:
+    """The sample server from the shared sample rows."""
+    return sample_world.server
+
+
+@pytest.fixture(scope="session")
 def sample_reservation_data(sample_restaurant, sample_party):
     """Sample reservation data for testing."""
     return {
         "restaurant_id": sample_restaurant.id,
         "party_id": sample_party.id,
-        "reservation_time": datetime(2025, 10, 20, 19, 0, 0),
+        "reservation_time": SEATING_TIME,
         "party_size": 4,
         "customer_name": "Test Customer",
         "customer_phone": "+1-555-0123",
@@ -191,7 +302,7 @@ def sample_reservation_data(sample_restaurant, sample_party):
 
 @pytest.fixture
 def sample_reservation(db_session: Session, sample_reservation_data):
-    """Create a sample reservation in the database."""
+    """Create a sample reservation, rolled back with the test that uses it."""
     reservation = Reservation(**sample_reservation_data)
     db_session.add(reservation)
     db_session.commit()
@@ -200,22 +311,28 @@ def sample_reservation(db_session: Session, sample_reservation_data):
 
 
 @pytest.fixture
-def sample_server_data(sample_restaurant):
-    """Sample server data for testing."""
-    return {
-        "restaurant_id": sample_restaurant.id,
-        "first_name": "John",
-        "last_name": "Server",
-        "employee_id": "EMP001",
-        "is_active": True
-    }
+def sample_assignment(db_session: Session, sample_party, sample_table, sample_server):
+    """Create a sample table assignment in the database."""
+    assignment = TableAssignment(
+        table_id=sample_table.id,
+        party_id=sample_party.id,
+        server_id=sample_server.id,
+        assigned_at=SEATING_TIME,
+        status="ACTIVE"
+    )
+    db_session.add(assignment)
+    db_session.commit()
+    db_session.refresh(assignment)
+    return assignment
 
 
 @pytest.fixture
-def sample_server(db_session: Session, sample_server_data):
-    """Create a sample server in the database."""
-    server = Server(**sample_server_data)
-    db_session.add(server)
-    db_session.commit()
-    db_session.refresh(server)
-    return server
+def created_assignment(db_session: Session, sample_party, sample_table, sample_server):
+    """Create a table assignment through AssignmentService, seating the sample party."""
+    assignment_data = TableAssignmentCreate(
+        table_id=sample_table.id,
+        party_id=sample_party.id,
+        server_id=sample_server.id,
+        assigned_at=SEATING_TIME
+    )
+    return AssignmentService(db_session).create_table_assignment(assignment_data)
@@ -7,12 +7,11 @@ import subprocess
 import os
 from pathlib import Path
 
-# Add the backend directory to the Python path
-backend_dir = Path(__file__).parent.parent / "backend"
-sys.path.insert(0, str(backend_dir))
-
 def run_tests(test_type="all", verbose=True):
-    """Run tests based on type."""
+    """Run tests based on type.
+    
+    Coverage tracing only runs for test_type="coverage".
+    """
     
     # Base pytest command
     cmd = ["python", "-m", "pytest"]
@@ -34,6 +33,16 @@ def run_tests(test_type="all", verbose=True):
     else:  # all
         cmd.append("tests/")
     
+    # Run in parallel with pytest-xdist; each worker process gets its own
+    # in-memory SQLite database, so no per-worker engine setup is needed.
+    # loadfile keeps each test file (and its classes) on a single worker.
+    if test_type in {"all", "fast", "api", "unit"}:
+        cmd.extend(["-n", os.environ.get("PYTEST_WORKERS", "auto"), "--dist=loadfile"])
+    
+    # Coverage is opt-in; don't load the pytest-cov tracer for other runs
+    if test_type != "coverage":
+        cmd.extend(["-p", "no:pytest_cov"])
+    
     # Add additional options
     cmd.extend([
         "--tb=short",
@@ -2,9 +2,45 @@
 Unit tests for API endpoints
 """
 import pytest
-from datetime import datetime
+import httpx
+import orjson
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
+
+from app.api.batch import _decode_body
+from app.database.connection import get_db
+
+# Route templates for the restaurant, section and table endpoints
+RESTAURANTS_URL = "/api/v1/restaurants/"
+RESTAURANT_URL = "/api/v1/restaurants/{restaurant_id}".format
+SECTIONS_URL = "/api/v1/restaurants/{restaurant_id}/sections".format
+SECTION_URL = "/api/v1/restaurants/{restaurant_id}/sections/{section_id}".format
+TABLES_URL = "/api/v1/restaurants/{restaurant_id}/tables".format
+TABLE_URL = "/api/v1/restaurants/{restaurant_id}/tables/{table_id}".format
+
+# Create payloads are encoded with orjson up front and posted as raw bytes
+JSON_HEADERS = {"content-type": "application/json"}
+
+NEW_RESTAURANT_BODY = orjson.dumps({
+    "name": "New Restaurant",
+    "address": "456 New St",
+    "phone": "+1-555-0456",
+    "opening_time": "10:00:00",
+    "closing_time": "23:00:00",
+    "max_capacity": 150
+})
+
+NEW_PARTY_BODY = orjson.dumps({
+    "name": "New Party",
+    "phone": "+1-555-0456",
+    "email": "new@example.com",
+    "size": 6,
+    "status": "WAITING"
+})
+
+
+def json_body(data: dict) -> dict:
+    """Request kwargs posting data as orjson-encoded bytes, for payloads built from fixtures"""
+    return {"content": orjson.dumps(data), "headers": JSON_HEADERS}
 
 
 class TestRestaurantAPI:
@@ -12,7 +48,7 @@ class TestRestaurantAPI:
     
     def test_get_restaurants(self, client: TestClient, sample_restaurant):
         """Test GET /api/v1/restaurants/"""
-        response = client.get("/api/v1/restaurants/")
+        response = client.get(RESTAURANTS_URL)
         assert response.status_code == 200
         
         data = response.json()
@@ -35,16 +71,7 @@ class TestRestaurantAPI:
     
     def test_create_restaurant(self, client: TestClient):
         """Test POST /api/v1/restaurants/"""
-        restaurant_data = {
-            "name": "New Restaurant",
-            "address": "456 New St",
-            "phone": "+1-555-0456",
-            "opening_time": "10:00:00",
-            "closing_time": "23:00:00",
-            "max_capacity": 150
-        }
-        
-        response = client.post("/api/v1/restaurants/", json=restaurant_data)
+        response = client.post(RESTAURANTS_URL, content=NEW_RESTAURANT_BODY, headers=JSON_HEADERS)
         assert response.status_code == 201
         
         data = response.json()
@@ -60,7 +87,7 @@ class TestRestaurantAPI:
             # Missing required fields
         }
         
-        response = client.post("/api/v1/restaurants/", json=invalid_data)
+        response = client.post(RESTAURANTS_URL, json=invalid_data)
         assert response.status_code == 422
         
         data = response.json()
@@ -69,7 +96,7 @@ class TestRestaurantAPI:
     
     def test_get_restaurant(self, client: TestClient, sample_restaurant):
         """Test GET /api/v1/restaurants/{restaurant_id}"""
-        response = client.get(f"/api/v1/restaurants/{sample_restaurant.id}")
+        response = client.get(RESTAURANT_URL(restaurant_id=sample_restaurant.id))
         assert response.status_code == 200
         
         data = response.json()
@@ -78,8 +105,58 @@ class TestRestaurantAPI:
     
     def test_get_restaurant_not_found(self, client: TestClient):
         """Test GET /api/v1/restaurants/{restaurant_id} with non-existent ID."""
-        response = client.get("/api/v1/restaurants/non-existent-id")
+        response = client.get(RESTAURANT_URL(restaurant_id="non-existent-id"))
+        assert response.status_code == 404
+    
+    def test_get_restaurant_not_modified(self, client: TestClient, sample_restaurant):
+        """Test GET /api/v1/restaurants/{id} with If-None-Match"""
+        response = client.get(RESTAURANT_URL(restaurant_id=sample_restaurant.id))
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        
+        response = client.get(RESTAURANT_URL(restaurant_id=sample_restaurant.id),
+                              headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+    
+    def test_not_modified_keeps_cors_headers(self, client: TestClient, sample_restaurant):
+        """Test a 304 still carries the CORS headers browsers need"""
+        origin = {"Origin": "http://frontend.example"}
+        response = client.get(RESTAURANT_URL(restaurant_id=sample_restaurant.id), headers=origin)
+        etag = response.headers["etag"]
+        
+        response = client.get(RESTAURANT_URL(restaurant_id=sample_restaurant.id),
+                              headers={**origin, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert "access-control-allow-origin" in response.headers
+        assert "content-type" not in response.headers
+    
+    def test_error_responses_have_no_etag(self, client: TestClient):
+        """Test only successful GETs are tagged"""
+        response = client.get(RESTAURANT_URL(restaurant_id="non-existent-id"))
         assert response.status_code == 404
+        assert "etag" not in response.headers
+    
+    def test_backend_entry_point_not_modified(self, db_session, sample_restaurant):
+        """Test the production entry point in backend/main.py serves the same conditional GETs"""
+        from main import app as backend_app
+        
+        backend_app.dependency_overrides[get_db] = lambda: db_session
+        try:
+            backend_client = TestClient(backend_app)
+            origin = {"Origin": "http://frontend.example"}
+            response = backend_client.get(RESTAURANT_URL(restaurant_id=sample_restaurant.id), headers=origin)
+            assert response.status_code == 200
+            etag = response.headers["etag"]
+            
+            response = backend_client.get(RESTAURANT_URL(restaurant_id=sample_restaurant.id),
+                                          headers={**origin, "If-None-Match": f'"other", {etag}'})
+            assert response.status_code == 304
+            assert response.headers["etag"] == etag
+            assert "access-control-allow-origin" in response.headers
+        finally:
+            backend_app.dependency_overrides.clear()
     
     def test_update_restaurant(self, client: TestClient, sample_restaurant):
         """Test PUT /api/v1/restaurants/{restaurant_id}"""
@@ -88,7 +165,7 @@ class TestRestaurantAPI:
             "max_capacity": 200
         }
         
-        response = client.put(f"/api/v1/restaurants/{sample_restaurant.id}", json=update_data)
+        response = client.put(RESTAURANT_URL(restaurant_id=sample_restaurant.id), json=update_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -98,11 +175,11 @@ class TestRestaurantAPI:
     
     def test_delete_restaurant(self, client: TestClient, sample_restaurant):
         """Test DELETE /api/v1/restaurants/{restaurant_id}"""
-        response = client.delete(f"/api/v1/restaurants/{sample_restaurant.id}")
+        response = client.delete(RESTAURANT_URL(restaurant_id=sample_restaurant.id))
         assert response.status_code == 204
         
         # Verify restaurant was deleted
-        response = client.get(f"/api/v1/restaurants/{sample_restaurant.id}")
+        response = client.get(RESTAURANT_URL(restaurant_id=sample_restaurant.id))
         assert response.status_code == 404
 
 
@@ -111,7 +188,7 @@ class TestSectionAPI:
     
     def test_get_sections(self, client: TestClient, sample_restaurant, sample_section):
         """Test GET /api/v1/restaurants/{restaurant_id}/sections"""
-        response = client.get(f"/api/v1/restaurants/{sample_restaurant.id}/sections")
+        response = client.get(SECTIONS_URL(restaurant_id=sample_restaurant.id))
         assert response.status_code == 200
         
         data = response.json()
@@ -128,7 +205,7 @@ class TestSectionAPI:
             "capacity": 30
         }
         
-        response = client.post(f"/api/v1/restaurants/{sample_restaurant.id}/sections", json=section_data)
+        response = client.post(SECTIONS_URL(restaurant_id=sample_restaurant.id), **json_body(section_data))
         assert response.status_code == 201
         
         data = response.json()
@@ -138,7 +215,7 @@ class TestSectionAPI:
     
     def test_get_section(self, client: TestClient, sample_restaurant, sample_section):
         """Test GET /api/v1/restaurants/{restaurant_id}/sections/{section_id}"""
-        response = client.get(f"/api/v1/restaurants/{sample_restaurant.id}/sections/{sample_section.id}")
+        response = client.get(SECTION_URL(restaurant_id=sample_restaurant.id, section_id=sample_section.id))
         assert response.status_code == 200
         
         data = response.json()
@@ -152,7 +229,7 @@ class TestSectionAPI:
             "capacity": 60
         }
         
-        response = client.put(f"/api/v1/restaurants/{sample_restaurant.id}/sections/{sample_section.id}", json=update_data)
+        response = client.put(SECTION_URL(restaurant_id=sample_restaurant.id, section_id=sample_section.id), json=update_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -161,7 +238,7 @@ class TestSectionAPI:
     
     def test_delete_section(self, client: TestClient, sample_restaurant, sample_section):
         """Test DELETE /api/v1/restaurants/{restaurant_id}/sections/{section_id}"""
-        response = client.delete(f"/api/v1/restaurants/{sample_restaurant.id}/sections/{sample_section.id}")
+        response = client.delete(SECTION_URL(restaurant_id=sample_restaurant.id, section_id=sample_section.id))
         assert response.status_code == 200
         
         data = response.json()
@@ -173,7 +250,7 @@ class TestTableAPI:
     
     def test_get_tables(self, client: TestClient, sample_restaurant, sample_table):
         """Test GET /api/v1/restaurants/{restaurant_id}/tables"""
-        response = client.get(f"/api/v1/restaurants/{sample_restaurant.id}/tables")
+        response = client.get(TABLES_URL(restaurant_id=sample_restaurant.id))
         assert response.status_code == 200
         
         data = response.json()
@@ -191,7 +268,7 @@ class TestTableAPI:
             "status": "AVAILABLE"
         }
         
-        response = client.post(f"/api/v1/restaurants/{sample_restaurant.id}/tables", json=table_data)
+        response = client.post(TABLES_URL(restaurant_id=sample_restaurant.id), **json_body(table_data))
         assert response.status_code == 201
         
         data = response.json()
@@ -201,7 +278,7 @@ class TestTableAPI:
     
     def test_get_table(self, client: TestClient, sample_restaurant, sample_table):
         """Test GET /api/v1/restaurants/{restaurant_id}/tables/{table_id}"""
-        response = client.get(f"/api/v1/restaurants/{sample_restaurant.id}/tables/{sample_table.id}")
+        response = client.get(TABLE_URL(restaurant_id=sample_restaurant.id, table_id=sample_table.id))
         assert response.status_code == 200
         
         data = response.json()
@@ -215,7 +292,7 @@ class TestTableAPI:
             "location": "Updated location"
         }
         
-        response = client.put(f"/api/v1/restaurants/{sample_restaurant.id}/tables/{sample_table.id}", json=update_data)
+        response = client.put(TABLE_URL(restaurant_id=sample_restaurant.id, table_id=sample_table.id), json=update_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -224,19 +301,20 @@ class TestTableAPI:
     
     def test_delete_table(self, client: TestClient, sample_restaurant, sample_table):
         """Test DELETE /api/v1/restaurants/{restaurant_id}/tables/{table_id}"""
-        response = client.delete(f"/api/v1/restaurants/{sample_restaurant.id}/tables/{sample_table.id}")
+        response = client.delete(TABLE_URL(restaurant_id=sample_restaurant.id, table_id=sample_table.id))
         assert response.status_code == 200
         
         data = response.json()
         assert data["message"] == "Table deleted successfully"
 
 
+@pytest.mark.asyncio
 class TestPartyAPI:
     """Test party API endpoints."""
     
-    def test_get_parties(self, client: TestClient, sample_party):
+    async def test_get_parties(self, async_client: httpx.AsyncClient, sample_party):
         """Test GET /api/v1/parties/"""
-        response = client.get("/api/v1/parties/")
+        response = await async_client.get("/api/v1/parties/")
         assert response.status_code == 200
         
         data = response.json()
@@ -244,17 +322,9 @@ class TestPartyAPI:
         assert len(data) == 1
         assert data[0]["name"] == "Test Party"
     
-    def test_create_party(self, client: TestClient):
+    async def test_create_party(self, async_client: httpx.AsyncClient):
         """Test POST /api/v1/parties/"""
-        party_data = {
-            "name": "New Party",
-            "phone": "+1-555-0456",
-            "email": "new@example.com",
-            "size": 6,
-            "status": "WAITING"
-        }
-        
-        response = client.post("/api/v1/parties/", json=party_data)
+        response = await async_client.post("/api/v1/parties/", content=NEW_PARTY_BODY, headers=JSON_HEADERS)
         assert response.status_code == 201
         
         data = response.json()
@@ -262,32 +332,32 @@ class TestPartyAPI:
         assert data["size"] == 6
         assert data["status"] == "WAITING"
     
-    def test_get_party(self, client: TestClient, sample_party):
+    async def test_get_party(self, async_client: httpx.AsyncClient, sample_party):
         """Test GET /api/v1/parties/{party_id}"""
-        response = client.get(f"/api/v1/parties/{sample_party.id}")
+        response = await async_client.get(f"/api/v1/parties/{sample_party.id}")
         assert response.status_code == 200
         
         data = response.json()
         assert data["name"] == "Test Party"
         assert data["id"] == sample_party.id
     
-    def test_update_party(self, client: TestClient, sample_party):
+    async def test_update_party(self, async_client: httpx.AsyncClient, sample_party):
         """Test PUT /api/v1/parties/{party_id}"""
         update_data = {
             "name": "Updated Party",
             "size": 8
         }
         
-        response = client.put(f"/api/v1/parties/{sample_party.id}", json=update_data)
+        response = await async_client.put(f"/api/v1/parties/{sample_party.id}", json=update_data)
         assert response.status_code == 200
         
         data = response.json()
         assert data["name"] == "Updated Party"
         assert data["size"] == 8
     
-    def test_delete_party(self, client: TestClient, sample_party):
+    async def test_delete_party(self, async_client: httpx.AsyncClient, sample_party):
         """Test DELETE /api/v1/parties/{party_id}"""
-        response = client.delete(f"/api/v1/parties/{sample_party.id}")
+        response = await async_client.delete(f"/api/v1/parties/{sample_party.id}")
         assert response.status_code == 204
 
 
@@ -303,6 +373,7 @@ class TestReservationAPI:
         assert isinstance(data, list)
         assert len(data) == 1
         assert data[0]["customer_name"] == "Test Customer"
+        assert data[0]["reservation_time"] == "2025-10-20T19:00:00"
     
     def test_create_reservation(self, client: TestClient, sample_restaurant, sample_party):
         """Test POST /api/v1/reservations/"""
@@ -318,7 +389,7 @@ class TestReservationAPI:
             "special_requests": "Quiet table"
         }
         
-        response = client.post("/api/v1/reservations/", json=reservation_data)
+        response = client.post("/api/v1/reservations/", **json_body(reservation_data))
         assert response.status_code == 201
         
         data = response.json()
@@ -355,12 +426,118 @@ class TestReservationAPI:
         assert response.status_code == 204
 
 
+class TestWaitingListAPI:
+    """Test waiting list API endpoints."""
+    
+    def _add_entry(self, client: TestClient, restaurant_id: str, customer_name: str = "Walk-in Customer") -> dict:
+        """Put a party of three on a restaurant's waiting list through the API"""
+        entry_data = {
+            "restaurant_id": restaurant_id,
+            "customer_name": customer_name,
+            "customer_phone": "+1-555-0789",
+            "party_size": 3,
+            "estimated_wait_time": 15
+        }
+        response = client.post("/api/v1/waiting-list/", **json_body(entry_data))
+        assert response.status_code == 201
+        return response.json()
+    
+    def test_seat_waiting_party(self, client: TestClient, sample_restaurant, sample_table, sample_server):
+        """Test POST /api/v1/waiting-list/{waiting_list_id}/seat"""
+        entry = self._add_entry(client, sample_restaurant.id)
+        
+        seat_data = {"table_id": sample_table.id, "server_id": sample_server.id, "notes": "Window seat"}
+        response = client.post(f"/api/v1/waiting-list/{entry['id']}/seat", **json_body(seat_data))
+        assert response.status_code == 201
+        
+        data = response.json()
+        assert data["table_id"] == sample_table.id
+        assert data["server_id"] == sample_server.id
+        assert data["notes"] == "Window seat"
+        
+        response = client.get(TABLES_URL(restaurant_id=sample_restaurant.id))
+        assert [table["status"] for table in response.json() if table["id"] == sample_table.id] == ["OCCUPIED"]
+        
+        response = client.get(f"/api/v1/waiting-list/{entry['id']}")
+        assert response.json()["status"] == "SEATED"
+    
+    def test_seat_waiting_party_not_found(self, client: TestClient, sample_table, sample_server):
+        """Test seating a non-existent waiting list entry"""
+        seat_data = {"table_id": sample_table.id, "server_id": sample_server.id}
+        response = client.post("/api/v1/waiting-list/non-existent-id/seat", **json_body(seat_data))
+        assert response.status_code == 404
+    
+    def test_seat_waiting_party_occupied_table(self, client: TestClient, sample_restaurant, sample_table,
+                                               sample_server):
+        """Test a table that was just seated cannot be given to the next party"""
+        first = self._add_entry(client, sample_restaurant.id, "First Customer")
+        second = self._add_entry(client, sample_restaurant.id, "Second Customer")
+        seat_data = {"table_id": sample_table.id, "server_id": sample_server.id}
+        
+        response = client.post(f"/api/v1/waiting-list/{first['id']}/seat", **json_body(seat_data))
+        assert response.status_code == 201
+        
+        response = client.post(f"/api/v1/waiting-list/{second['id']}/seat", **json_body(seat_data))
+        assert response.status_code == 400
+        assert response.json()["message"] == "Table is not available for assignment"
+        
+        response = client.get(f"/api/v1/waiting-list/{second['id']}")
+        assert response.json()["status"] == "WAITING"
+    
+    def test_seat_waiting_party_inactive_server(self, client: TestClient, sample_restaurant, sample_table):
+        """Test an inactive server cannot be given the party"""
+        entry = self._add_entry(client, sample_restaurant.id)
+        server_data = {
+            "restaurant_id": sample_restaurant.id,
+            "first_name": "Off",
+            "last_name": "Duty",
+            "employee_id": "EMP003",
+            "is_active": False
+        }
+        server = client.post("/api/v1/servers/", **json_body(server_data)).json()
+        
+        seat_data = {"table_id": sample_table.id, "server_id": server["id"]}
+        response = client.post(f"/api/v1/waiting-list/{entry['id']}/seat", **json_body(seat_data))
+        assert response.status_code == 400
+        assert response.json()["message"] == "Server is not available for assignment"
+    
+    def test_seat_waiting_party_other_restaurant(self, client: TestClient, sample_restaurant, sample_table,
+                                                 sample_server):
+        """Test a party cannot be seated with another restaurant's server or at its table"""
+        other = client.post(RESTAURANTS_URL, content=NEW_RESTAURANT_BODY, headers=JSON_HEADERS).json()
+        server_data = {
+            "restaurant_id": other["id"],
+            "first_name": "Olive",
+            "last_name": "Server",
+            "employee_id": "EMP900"
+        }
+        other_server = client.post("/api/v1/servers/", **json_body(server_data)).json()
+        
+        # Our entry with the other restaurant's server
+        entry = self._add_entry(client, sample_restaurant.id)
+        seat_data = {"table_id": sample_table.id, "server_id": other_server["id"]}
+        response = client.post(f"/api/v1/waiting-list/{entry['id']}/seat", **json_body(seat_data))
+        assert response.status_code == 400
+        assert response.json()["message"] == "Server is not available for assignment"
+        
+        # The other restaurant's entry at our table
+        other_entry = self._add_entry(client, other["id"])
+        seat_data = {"table_id": sample_table.id, "server_id": other_server["id"]}
+        response = client.post(f"/api/v1/waiting-list/{other_entry['id']}/seat", **json_body(seat_data))
+        assert response.status_code == 400
+        assert response.json()["message"] == "Table is not available for assignment"
+        
+        response = client.get(TABLES_URL(restaurant_id=sample_restaurant.id))
+        assert [table["status"] for table in response.json() if table["id"] == sample_table.id] == ["AVAILABLE"]
+
+
+@pytest.mark.asyncio
 class TestServerAPI:
     """Test server API endpoints."""
     
-    def test_get_servers(self, client: TestClient, sample_server):
+    async def test_get_servers(self, async_client: httpx.AsyncClient, sample_server):
         """Test GET /api/v1/servers/"""
-        response = client.get("/api/v1/servers/")
+        response = await async_client.get("/api/v1/servers/")
         assert response.status_code == 200
         
         data = response.json()
@@ -368,7 +545,7 @@ class TestServerAPI:
         assert len(data) == 1
         assert data[0]["first_name"] == "John"
     
-    def test_create_server(self, client: TestClient, sample_restaurant):
+    async def test_create_server(self, async_client: httpx.AsyncClient, sample_restaurant):
         """Test POST /api/v1/servers/"""
         server_data = {
             "restaurant_id": sample_restaurant.id,
@@ -378,66 +555,52 @@ class TestServerAPI:
             "is_active": True
         }
         
-        response = client.post("/api/v1/servers/", json=server_data)
+        response = await async_client.post("/api/v1/servers/", **json_body(server_data))
         assert response.status_code == 201
         
         data = response.json()
         assert data["first_name"] == "Jane"
         assert data["employee_id"] == "EMP002"
     
-    def test_get_server(self, client: TestClient, sample_server):
+    async def test_get_server(self, async_client: httpx.AsyncClient, sample_server):
         """Test GET /api/v1/servers/{server_id}"""
-        response = client.get(f"/api/v1/servers/{sample_server.id}")
+        response = await async_client.get(f"/api/v1/servers/{sample_server.id}")
         assert response.status_code == 200
         
         data = response.json()
         assert data["first_name"] == "John"
         assert data["id"] == sample_server.id
     
-    def test_update_server(self, client: TestClient, sample_server):
+    async def test_update_server(self, async_client: httpx.AsyncClient, sample_server):
         """Test PUT /api/v1/servers/{server_id}"""
         update_data = {
             "first_name": "Johnny"
         }
         
-        response = client.put(f"/api/v1/servers/{sample_server.id}", json=update_data)
+        response = await async_client.put(f"/api/v1/servers/{sample_server.id}", json=update_data)
         assert response.status_code == 200
         
         data = response.json()
         assert data["first_name"] == "Johnny"
     
-    def test_delete_server(self, client: TestClient, sample_server):
+    async def test_delete_server(self, async_client: httpx.AsyncClient, sample_server):
         """Test DELETE /api/v1/servers/{server_id}"""
-        response = client.delete(f"/api/v1/servers/{sample_server.id}")
+        response = await async_client.delete(f"/api/v1/servers/{sample_server.id}")
         assert response.status_code == 204
 
 
 class TestAssignmentAPI:
     """Test assignment API endpoints."""
     
-    def test_get_table_assignments(self, client: TestClient, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_get_table_assignments(self, client: TestClient, sample_assignment):
         """Test GET /api/v1/assignments/table-assignments/"""
-        # First create an assignment
-        assignment_data = {
-            "restaurant_id": sample_restaurant.id,
-            "table_id": sample_table.id,
-            "party_id": sample_party.id,
-            "server_id": sample_server.id,
-            "assigned_at": "2025-10-20T19:00:00",
-            "status": "ASSIGNED"
-        }
-        
-        create_response = client.post("/api/v1/assignments/table-assignments", json=assignment_data)
-        assert create_response.status_code == 201
-        
-        # Now test getting assignments
         response = client.get("/api/v1/assignments/table-assignments/")
         assert response.status_code == 200
         
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 1
-        assert data[0]["table_id"] == sample_table.id
+        assert data[0]["table_id"] == sample_assignment.table_id
     
     def test_create_table_assignment(self, client: TestClient, sample_restaurant, sample_party, sample_table, sample_server):
         """Test POST /api/v1/assignments/table-assignments"""
@@ -450,7 +613,7 @@ class TestAssignmentAPI:
             "status": "ASSIGNED"
         }
         
-        response = client.post("/api/v1/assignments/table-assignments", json=assignment_data)
+        response = client.post("/api/v1/assignments/table-assignments", **json_body(assignment_data))
         assert response.status_code == 201
         
         data = response.json()
@@ -459,45 +622,21 @@ class TestAssignmentAPI:
         assert data["server_id"] == sample_server.id
         assert data["status"] == "ASSIGNED"
     
-    def test_get_table_assignment(self, client: TestClient, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_get_table_assignment(self, client: TestClient, sample_assignment):
         """Test GET /api/v1/assignments/table-assignments/{assignment_id}"""
-        # First create an assignment
-        assignment_data = {
-            "restaurant_id": sample_restaurant.id,
-            "table_id": sample_table.id,
-            "party_id": sample_party.id,
-            "server_id": sample_server.id,
-            "assigned_at": "2025-10-20T19:00:00",
-            "status": "ASSIGNED"
-        }
-        
-        create_response = client.post("/api/v1/assignments/table-assignments", json=assignment_data)
-        assignment_id = create_response.json()["id"]
+        assignment_id = sample_assignment.id
         
-        # Now test getting the assignment
         response = client.get(f"/api/v1/assignments/table-assignments/{assignment_id}")
         assert response.status_code == 200
         
         data = response.json()
-        assert data["table_id"] == sample_table.id
+        assert data["table_id"] == sample_assignment.table_id
         assert data["id"] == assignment_id
     
-    def test_update_table_assignment(self, client: TestClient, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_update_table_assignment(self, client: TestClient, sample_assignment):
         """Test PUT /api/v1/assignments/table-assignments/{assignment_id}"""
-        # First create an assignment
-        assignment_data = {
-            "restaurant_id": sample_restaurant.id,
-            "table_id": sample_table.id,
-            "party_id": sample_party.id,
-            "server_id": sample_server.id,
-            "assigned_at": "2025-10-20T19:00:00",
-            "status": "ASSIGNED"
-        }
+        assignment_id = sample_assignment.id
         
-        create_response = client.post("/api/v1/assignments/table-assignments", json=assignment_data)
-        assignment_id = create_response.json()["id"]
-        
-        # Now test updating the assignment
         update_data = {
             "status": "COMPLETED",
             "notes": "Service completed successfully"
@@ -510,32 +649,86 @@ class TestAssignmentAPI:
         assert data["status"] == "COMPLETED"
         assert data["notes"] == "Service completed successfully"
     
-    def test_delete_table_assignment(self, client: TestClient, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_delete_table_assignment(self, client: TestClient, sample_assignment):
         """Test DELETE /api/v1/assignments/table-assignments/{assignment_id}"""
-        # First create an assignment
-        assignment_data = {
-            "restaurant_id": sample_restaurant.id,
-            "table_id": sample_table.id,
-            "party_id": sample_party.id,
-            "server_id": sample_server.id,
-            "assigned_at": "2025-10-20T19:00:00",
-            "status": "ASSIGNED"
-        }
+        assignment_id = sample_assignment.id
         
-        create_response = client.post("/api/v1/assignments/table-assignments", json=assignment_data)
-        assignment_id = create_response.json()["id"]
-        
-        # Now test deleting the assignment
         response = client.delete(f"/api/v1/assignments/table-assignments/{assignment_id}")
         assert response.status_code == 204
 
 
+class TestBatchAPI:
+    """Test batch API endpoint."""
+    
+    def test_batch_requests(self, client: TestClient, sample_restaurant):
+        """Test POST /api/v1/batch/"""
+        batch_data = {
+            "requests": [
+                {"id": 0, "method": "GET", "url": f"/restaurants/{sample_restaurant.id}"},
+                {"id": 1, "method": "GET", "url": "/restaurants/non-existent-id"}
+            ]
+        }
+        
+        response = client.post("/api/v1/batch/", json=batch_data)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert len(data["responses"]) == 2
+        assert data["responses"][0]["id"] == 0
+        assert data["responses"][0]["status_code"] == 200
+        assert data["responses"][0]["body"]["name"] == "Test Restaurant"
+        assert data["responses"][1]["id"] == 1
+        assert data["responses"][1]["status_code"] == 404
+    
+    def test_batch_seat_context(self, client: TestClient, sample_restaurant, sample_server):
+        """Test the frontend's seat-context batch reaches the next-party and server routes"""
+        batch_data = {
+            "requests": [
+                {"id": 0, "method": "GET", "url": f"/waiting-list/restaurants/{sample_restaurant.id}/next"},
+                {"id": 1, "method": "GET",
+                 "url": f"/servers/?restaurant_id={sample_restaurant.id}&is_active=true"}
+            ]
+        }
+        
+        response = client.post("/api/v1/batch/", json=batch_data)
+        assert response.status_code == 200
+        
+        next_party, servers = response.json()["responses"]
+        assert next_party["status_code"] == 404  # Nobody is waiting
+        assert servers["status_code"] == 200
+        assert [server["id"] for server in servers["body"]] == [sample_server.id]
+    
+    @pytest.mark.parametrize("url", ["/batch/", "batch", "/api/v1/batch/"])
+    def test_batch_rejects_nested_batch(self, client: TestClient, url):
+        """Test a batch cannot contain another batch call"""
+        batch_data = {"requests": [{"id": 0, "method": "POST", "url": url, "body": {"requests": []}}]}
+        
+        response = client.post("/api/v1/batch/", json=batch_data)
+        assert response.status_code == 400
+        assert response.json()["message"] == "Batch requests cannot be nested"
+    
+    @pytest.mark.parametrize("count", [0, 21])
+    def test_batch_size_is_bounded(self, client: TestClient, count):
+        """Test an empty or oversized batch is rejected before any sub-request runs"""
+        batch_data = {"requests": [{"id": i, "method": "GET", "url": "/restaurants/"} for i in range(count)]}
+        
+        response = client.post("/api/v1/batch/", json=batch_data)
+        assert response.status_code == 422
+    
+    def test_batch_decodes_only_json_bodies(self):
+        """Test non-JSON sub-responses are passed through as text instead of failing the batch"""
+        assert _decode_body(httpx.Response(200, json={"status": "ok"})) == {"status": "ok"}
+        assert _decode_body(httpx.Response(200, text="plain text")) == "plain text"
+        assert _decode_body(httpx.Response(204)) is None
+
+
+@pytest.mark.asyncio
 class TestHealthEndpoints:
     """Test health and utility endpoints."""
     
-    def test_health_check(self, client: TestClient):
+    async def test_health_check(self, async_client: httpx.AsyncClient):
         """Test GET /health"""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         assert response.status_code == 200
         
         data = response.json()
@@ -543,9 +736,9 @@ class TestHealthEndpoints:
         assert "timestamp" in data
         assert "version" in data
     
-    def test_root_endpoint(self, client: TestClient):
+    async def test_root_endpoint(self, async_client: httpx.AsyncClient):
         """Test GET /"""
-        response = client.get("/")
+        response = await async_client.get("/")
         assert response.status_code == 200
         
         data = response.json()
@@ -2,45 +2,42 @@
 Unit tests for complex operations and business logic
 """
 import pytest
-from datetime import datetime, date, time
+from datetime import date, time
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from fastapi.testclient import TestClient
 
 from app.services.restaurant_service import RestaurantService
-from app.services.party_service import PartyService
-from app.services.reservation_service import ReservationService
-from app.services.assignment_service import AssignmentService
-from app.models.database import (
-    Restaurant, Section, Table, Party, Reservation, Server, TableAssignment
-)
+from app.models.database import Table, Party, Reservation
+from tests._sql_count import count_queries
 
 
 class TestComplexRestaurantOperations:
     """Test complex restaurant operations."""
     
-    def test_assign_table_to_party(self, db_session: Session, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_assign_table_to_party(self, db_session: Session, sample_world):
         """Test assigning a table to a party."""
         service = RestaurantService(db_session)
         
         # Test table assignment
         result = service.assign_table_to_party(
-            restaurant_id=sample_restaurant.id,
-            table_id=sample_table.id,
-            party_id=sample_party.id,
-            server_id=sample_server.id
+            restaurant_id=sample_world.restaurant.id,
+            table_id=sample_world.table.id,
+            party_id=sample_world.party.id,
+            server_id=sample_world.server.id
         )
         
         assert result is not None
-        assert result["table_id"] == sample_table.id
-        assert result["party_id"] == sample_party.id
-        assert result["server_id"] == sample_server.id
+        assert result["table_id"] == sample_world.table.id
+        assert result["party_id"] == sample_world.party.id
+        assert result["server_id"] == sample_world.server.id
         
         # Verify table status changed
-        table = db_session.query(Table).filter_by(id=sample_table.id).first()
+        table = db_session.get(Table, sample_world.table.id)
         assert table.status == "OCCUPIED"
         
         # Verify party status changed
-        party = db_session.query(Party).filter_by(id=sample_party.id).first()
+        party = db_session.get(Party, sample_world.party.id)
         assert party.status == "SEATED"
     
     def test_check_table_availability(self, db_session: Session, sample_restaurant, sample_table):
@@ -60,7 +57,7 @@ class TestComplexRestaurantOperations:
         
         # Test occupied table
         sample_table.status = "OCCUPIED"
-        db_session.commit()
+        db_session.flush()
         
         availability = service.check_table_availability(
             restaurant_id=sample_restaurant.id,
@@ -77,7 +74,7 @@ class TestComplexRestaurantOperations:
         
         # Create some test data
         sample_table.status = "OCCUPIED"
-        db_session.commit()
+        db_session.flush()
         
         analytics = service.get_occupancy_analytics(
             restaurant_id=sample_restaurant.id,
@@ -97,9 +94,8 @@ class TestComplexRestaurantOperations:
 class TestReservationWorkflow:
     """Test complete reservation workflow."""
     
-    def test_complete_reservation_workflow(self, client: TestClient, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_complete_reservation_workflow(self, client: TestClient, db_session: Session, sample_restaurant, sample_party, sample_table, sample_server):
         """Test complete reservation workflow from creation to table assignment."""
-        
         # 1. Create a reservation
         reservation_data = {
             "restaurant_id": sample_restaurant.id,
@@ -116,6 +112,8 @@ class TestReservationWorkflow:
         reservation_response = client.post("/api/v1/reservations/", json=reservation_data)
         assert reservation_response.status_code == 201
         reservation_id = reservation_response.json()["id"]
+        # The app writes through this test's session, so the row is visible without a commit
+        assert db_session.query(Reservation).count() == 1
         
         # 2. Assign table to reservation
         assignment_data = {
@@ -158,6 +156,37 @@ class TestReservationWorkflow:
         final_assignment = completion_response.json()
         assert final_assignment["status"] == "COMPLETED"
         assert final_assignment["notes"] == "Service completed successfully"
+    
+    def test_table_assignment_query_counts(self, client: TestClient, db_session: Session, sample_party, sample_table, sample_server):
+        """Test the assignment create, read and complete endpoints stay within their query budgets."""
+        conn = db_session.connection()
+        assignment_data = {
+            "table_id": sample_table.id,
+            "party_id": sample_party.id,
+            "server_id": sample_server.id
+        }
+        
+        with count_queries(conn) as queries:
+            assignment_response = client.post("/api/v1/assignments/table-assignments", json=assignment_data)
+        assert assignment_response.status_code == 201
+        assert len(queries) <= 8
+        assignment_id = assignment_response.json()["id"]
+        
+        with count_queries(conn) as queries:
+            assignment_response = client.get(f"/api/v1/assignments/table-assignments/{assignment_id}")
+        assert assignment_response.status_code == 200
+        assert len(queries) <= 1
+        assert assignment_response.json()["status"] == "ACTIVE"
+        
+        completion_data = {
+            "status": "COMPLETED",
+            "notes": "Service completed successfully"
+        }
+        with count_queries(conn) as queries:
+            completion_response = client.put(f"/api/v1/assignments/table-assignments/{assignment_id}", json=completion_data)
+        assert completion_response.status_code == 200
+        assert len(queries) <= 7
+        assert completion_response.json()["status"] == "COMPLETED"
 
 
 class TestWaitingListOperations:
@@ -281,7 +310,7 @@ class TestErrorHandling:
         response = client.post("/api/v1/assignments/table-assignments", json=assignment_data)
         assert response.status_code == 404
     
-    def test_assign_occupied_table(self, client: TestClient, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_assign_occupied_table(self, client: TestClient, db_session: Session, sample_restaurant, sample_party, sample_table, sample_server):
         """Test assigning already occupied table."""
         # First assign the table
         assignment_data = {
@@ -297,16 +326,15 @@ class TestErrorHandling:
         assert response.status_code == 201
         
         # Try to assign the same table to another party
-        another_party_data = {
-            "name": "Another Party",
-            "phone": "+1-555-0456",
-            "email": "another@example.com",
-            "size": 2,
-            "status": "WAITING"
-        }
-        
-        party_response = client.post("/api/v1/parties/", json=another_party_data)
-        another_party_id = party_response.json()["id"]
+        another_party_id = db_session.execute(
+            insert(Party).values(
+                name="Another Party",
+                phone="+1-555-0456",
+                email="another@example.com",
+                size=2,
+                status="WAITING"
+            ).returning(Party.id)
+        ).scalar_one()
         
         duplicate_assignment_data = {
             "restaurant_id": sample_restaurant.id,
@@ -321,3 +349,23 @@ class TestErrorHandling:
         # This should either succeed (if we allow multiple assignments) or fail with appropriate error
         # The behavior depends on business logic implementation
         assert response.status_code in [201, 400, 409]  # Success, Bad Request, or Conflict
+    
+    def test_concurrent_assign_rejects_second(self, client: TestClient, db_session: Session, sample_party, sample_table, sample_server):
+        """Test a second assignment of a just-claimed table is rejected and leaves its party waiting."""
+        another_party_id = db_session.execute(
+            insert(Party).values(name="Another Party", size=2, status="WAITING").returning(Party.id)
+        ).scalar_one()
+        
+        responses = [
+            client.post("/api/v1/assignments/table-assignments", json={
+                "table_id": sample_table.id,
+                "party_id": party_id,
+                "server_id": sample_server.id
+            })
+            for party_id in (sample_party.id, another_party_id)
+        ]
+        assert [response.status_code for response in responses] == [201, 400]
+        assert responses[1].json()["message"] == "Table is not available for assignment"
+        
+        assert db_session.get(Table, sample_table.id).status == "OCCUPIED"
+        assert db_session.get(Party, another_party_id).status == "WAITING"
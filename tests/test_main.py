@@ -2,7 +2,6 @@
 Tests for main application
 """
 
-import pytest
 from fastapi.testclient import TestClient
 
 
@@ -2,18 +2,18 @@
 Unit tests for Pydantic models and SQLAlchemy models
 """
 import pytest
-import uuid
-from datetime import datetime, date, time
+from datetime import datetime
 from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import selectinload
 
 from app.models.schemas import (
-    Restaurant, RestaurantCreate, RestaurantUpdate,
-    Section, SectionCreate, SectionUpdate,
-    Table, TableCreate, TableUpdate,
-    Party, PartyCreate, PartyUpdate,
-    Reservation, ReservationCreate, ReservationUpdate,
-    Server, ServerCreate, ServerUpdate,
-    TableAssignment, TableAssignmentCreate, TableAssignmentUpdate,
+    RestaurantCreate, RestaurantUpdate,
+    TableCreate,
+    PartyCreate,
+    Reservation, ReservationCreate,
+    ServerCreate,
+    TableAssignmentCreate,
     TableStatus, PartyStatus, ReservationStatus, AssignmentStatus
 )
 from app.models.database import (
@@ -25,23 +25,40 @@ from app.models.database import (
     Server as ServerModel,
     TableAssignment as TableAssignmentModel
 )
+from app.api.responses import dump_model
+from tests._payloads import (
+    SEATING_TIME, NEXT_DAY_SEATING_TIME,
+    RESTAURANT_ID, PARTY_ID, TABLE_ID, SERVER_ID,
+    RESTAURANT_PAYLOAD, TABLE_PAYLOAD, PARTY_PAYLOAD,
+    RESERVATION_PAYLOAD, SERVER_PAYLOAD, TABLE_ASSIGNMENT_PAYLOAD
+)
+from tests._sql_count import count_queries
+
+# Status members bound once; values read back from the database are these singletons
+AVAILABLE = TableStatus.AVAILABLE
+OCCUPIED = TableStatus.OCCUPIED
+WAITING = PartyStatus.WAITING
+SEATED = PartyStatus.SEATED
+PENDING = ReservationStatus.PENDING
+CONFIRMED = ReservationStatus.CONFIRMED
+
+
+def bulk_create(session, model, rows):
+    """Insert rows for a model in one batched statement and return them."""
+    table = model.__table__
+    statement = insert(table).returning(*table.c, sort_by_parameter_order=True)
+    return session.execute(statement, rows).all()
 
 
 class TestPydanticModels:
     """Test Pydantic model validation and serialization."""
     
+    pytestmark = pytest.mark.no_db
+    
     def test_restaurant_create_validation(self):
         """Test RestaurantCreate model validation."""
         # Valid data
-        valid_data = {
-            "name": "Test Restaurant",
-            "address": "123 Test St",
-            "phone": "+1-555-0123",
-            "opening_time": "09:00:00",
-            "closing_time": "22:00:00",
-            "max_capacity": 100
-        }
-        restaurant = RestaurantCreate(**valid_data)
+        restaurant = RestaurantCreate.model_validate(RESTAURANT_PAYLOAD)
         assert restaurant.name == "Test Restaurant"
         assert restaurant.max_capacity == 100
         
@@ -53,7 +70,7 @@ class TestPydanticModels:
         """Test RestaurantUpdate model validation."""
         # All fields optional
         update_data = {"name": "Updated Restaurant"}
-        restaurant = RestaurantUpdate(**update_data)
+        restaurant = RestaurantUpdate.model_validate(update_data)
         assert restaurant.name == "Updated Restaurant"
         assert restaurant.address is None
         
@@ -61,111 +78,55 @@ class TestPydanticModels:
         empty_update = RestaurantUpdate()
         assert empty_update.name is None
     
-    def test_table_status_enum(self):
-        """Test TableStatus enum values."""
-        assert TableStatus.AVAILABLE == "AVAILABLE"
-        assert TableStatus.OCCUPIED == "OCCUPIED"
-        assert TableStatus.RESERVED == "RESERVED"
-        assert TableStatus.OUT_OF_ORDER == "OUT_OF_ORDER"
-        assert TableStatus.CLEANING == "CLEANING"
-    
-    def test_party_status_enum(self):
-        """Test PartyStatus enum values."""
-        assert PartyStatus.WAITING == "WAITING"
-        assert PartyStatus.SEATED == "SEATED"
-        assert PartyStatus.FINISHED == "FINISHED"
-        assert PartyStatus.CANCELLED == "CANCELLED"
-    
-    def test_reservation_status_enum(self):
-        """Test ReservationStatus enum values."""
-        assert ReservationStatus.PENDING == "PENDING"
-        assert ReservationStatus.CONFIRMED == "CONFIRMED"
-        assert ReservationStatus.CANCELLED == "CANCELLED"
-        assert ReservationStatus.NO_SHOW == "NO_SHOW"
-        assert ReservationStatus.COMPLETED == "COMPLETED"
+    @pytest.mark.parametrize("enum_cls,values", [
+        (TableStatus, ["AVAILABLE", "OCCUPIED", "RESERVED", "OUT_OF_ORDER", "CLEANING"]),
+        (PartyStatus, ["WAITING", "SEATED", "FINISHED", "CANCELLED"]),
+        (ReservationStatus, ["PENDING", "CONFIRMED", "CANCELLED", "NO_SHOW", "COMPLETED"]),
+        (AssignmentStatus, ["ACTIVE", "COMPLETED", "CANCELLED"]),
+    ])
+    def test_status_enum_values(self, enum_cls, values):
+        """Test status enum members match their wire values."""
+        for value in values:
+            assert getattr(enum_cls, value) == value
+            assert enum_cls(value) is getattr(enum_cls, value)
     
     def test_table_create_validation(self):
         """Test TableCreate model validation."""
-        valid_data = {
-            "restaurant_id": "123e4567-e89b-12d3-a456-426614174000",
-            "table_number": "T-01",
-            "capacity": 4,
-            "location": "Near window",
-            "status": "AVAILABLE"
-        }
-        table = TableCreate(**valid_data)
+        table = TableCreate.model_validate(TABLE_PAYLOAD)
         assert table.table_number == "T-01"
         assert table.capacity == 4
         assert table.status == TableStatus.AVAILABLE
         
         # Invalid status
         with pytest.raises(ValidationError):
-            TableCreate(
-                restaurant_id="123e4567-e89b-12d3-a456-426614174000",
-                table_number="T-01",
-                capacity=4,
-                location="Near window",
-                status="INVALID_STATUS"
-            )
+            TableCreate.model_validate(TABLE_PAYLOAD | {"status": "INVALID_STATUS"})
     
     def test_party_create_validation(self):
         """Test PartyCreate model validation."""
-        valid_data = {
-            "name": "Test Party",
-            "phone": "+1-555-0123",
-            "email": "test@example.com",
-            "size": 4,
-            "status": "WAITING"
-        }
-        party = PartyCreate(**valid_data)
+        party = PartyCreate.model_validate(PARTY_PAYLOAD)
         assert party.name == "Test Party"
         assert party.size == 4
         assert party.status == PartyStatus.WAITING
     
     def test_reservation_create_validation(self):
         """Test ReservationCreate model validation."""
-        valid_data = {
-            "restaurant_id": "123e4567-e89b-12d3-a456-426614174000",
-            "reservation_time": datetime(2025, 10, 20, 19, 0, 0),
-            "party_size": 4,
-            "customer_name": "Test Customer",
-            "customer_phone": "+1-555-0123",
-            "customer_email": "test@example.com",
-            "special_requests": "Window table"
-        }
-        reservation = ReservationCreate(**valid_data)
+        reservation = ReservationCreate.model_validate(RESERVATION_PAYLOAD)
         assert reservation.customer_name == "Test Customer"
         assert reservation.party_size == 4
-        assert reservation.restaurant_id == "123e4567-e89b-12d3-a456-426614174000"
+        assert reservation.restaurant_id == RESTAURANT_ID
     
     def test_server_create_validation(self):
         """Test ServerCreate model validation."""
-        valid_data = {
-            "restaurant_id": "123e4567-e89b-12d3-a456-426614174000",
-            "first_name": "John",
-            "last_name": "Server",
-            "employee_id": "EMP001",
-            "phone": "+1-555-0199",
-            "email": "john@test.com",
-            "is_active": True
-        }
-        server = ServerCreate(**valid_data)
+        server = ServerCreate.model_validate(SERVER_PAYLOAD)
         assert server.first_name == "John"
         assert server.last_name == "Server"
         assert server.employee_id == "EMP001"
     
     def test_table_assignment_create_validation(self):
         """Test TableAssignmentCreate model validation."""
-        valid_data = {
-            "restaurant_id": "123e4567-e89b-12d3-a456-426614174000",
-            "table_id": "123e4567-e89b-12d3-a456-426614174002",
-            "party_id": "123e4567-e89b-12d3-a456-426614174001",
-            "server_id": "123e4567-e89b-12d3-a456-426614174003",
-            "assigned_at": datetime(2025, 10, 20, 19, 0, 0)
-        }
-        assignment = TableAssignmentCreate(**valid_data)
-        assert assignment.table_id == "123e4567-e89b-12d3-a456-426614174002"
-        assert assignment.party_id == "123e4567-e89b-12d3-a456-426614174001"
+        assignment = TableAssignmentCreate.model_validate(TABLE_ASSIGNMENT_PAYLOAD)
+        assert assignment.table_id == TABLE_ID
+        assert assignment.party_id == PARTY_ID
 
 
 class TestSQLAlchemyModels:
@@ -182,8 +143,7 @@ class TestSQLAlchemyModels:
             max_capacity=100
         )
         db_session.add(restaurant)
-        db_session.commit()
-        db_session.refresh(restaurant)
+        db_session.flush()
         
         assert restaurant.id is not None
         assert restaurant.name == "Test Restaurant"
@@ -191,136 +151,81 @@ class TestSQLAlchemyModels:
         assert restaurant.created_at is not None
         assert restaurant.updated_at is not None
     
-    def test_section_model_creation(self, db_session, sample_restaurant):
-        """Test Section model creation."""
-        section = SectionModel(
-            restaurant_id=sample_restaurant.id,
-            name="Main Dining",
-            description="Main dining area",
-            capacity=50,
-            is_active=True
-        )
-        db_session.add(section)
-        db_session.commit()
-        db_session.refresh(section)
-        
-        assert section.id is not None
-        assert section.name == "Main Dining"
-        assert section.restaurant_id == sample_restaurant.id
-        assert section.is_active is True
-    
-    def test_table_model_creation(self, db_session, sample_restaurant):
-        """Test Table model creation."""
-        table = TableModel(
-            restaurant_id=sample_restaurant.id,
-            table_number="T-01",
-            capacity=4,
-            location="Near window",
-            status="AVAILABLE",
-            is_active=True
-        )
-        db_session.add(table)
-        db_session.commit()
-        db_session.refresh(table)
-        
-        assert table.id is not None
-        assert table.table_number == "T-01"
-        assert table.capacity == 4
-        assert table.status == "AVAILABLE"
-    
-    def test_party_model_creation(self, db_session):
-        """Test Party model creation."""
-        party = PartyModel(
-            name="Test Party",
-            phone="+1-555-0123",
-            email="test@example.com",
-            size=4,
-            status="WAITING"
-        )
-        db_session.add(party)
-        db_session.commit()
-        db_session.refresh(party)
-        
-        assert party.id is not None
-        assert party.name == "Test Party"
-        assert party.size == 4
-        assert party.status == "WAITING"
-        assert party.arrival_time is not None
-    
-    def test_reservation_model_creation(self, db_session, sample_restaurant, sample_party):
-        """Test Reservation model creation."""
-        reservation = ReservationModel(
-            restaurant_id=sample_restaurant.id,
-            party_id=sample_party.id,
-            reservation_time=datetime(2025, 10, 20, 19, 0, 0),
-            party_size=4,
-            customer_name="Test Customer",
-            customer_phone="+1-555-0123",
-            customer_email="test@example.com",
-            status="CONFIRMED",
-            special_requests="Window table"
-        )
-        db_session.add(reservation)
-        db_session.commit()
-        db_session.refresh(reservation)
+    @pytest.mark.parametrize("model,foreign_keys,rows", [
+        (SectionModel, ("restaurant_id",), [
+            {"name": "Main Dining", "description": "Main dining area", "capacity": 50, "is_active": True},
+            {"name": "Patio", "description": "Outdoor seating", "capacity": 20, "is_active": False},
+        ]),
+        (TableModel, ("restaurant_id",), [
+            {"table_number": "T-01", "capacity": 4, "location": "Near window", "status": AVAILABLE, "is_active": True},
+            {"table_number": "T-02", "capacity": 2, "location": "Bar", "status": OCCUPIED, "is_active": True},
+        ]),
+        (PartyModel, (), [
+            {"name": "Test Party", "phone": "+1-555-0123", "email": "test@example.com", "size": 4, "status": WAITING},
+            {"name": "Walk-in Party", "phone": "+1-555-0124", "email": None, "size": 2, "status": SEATED},
+        ]),
+        (ReservationModel, ("restaurant_id", "party_id"), [
+            {"reservation_time": SEATING_TIME, "party_size": 4,
+             "customer_name": "Test Customer", "customer_phone": "+1-555-0123",
+             "customer_email": "test@example.com", "status": CONFIRMED, "special_requests": "Window table"},
+            {"reservation_time": NEXT_DAY_SEATING_TIME, "party_size": 2,
+             "customer_name": "Second Customer", "customer_phone": "+1-555-0124",
+             "customer_email": None, "status": PENDING, "special_requests": None},
+        ]),
+        (ServerModel, ("restaurant_id",), [
+            {"first_name": "John", "last_name": "Server", "employee_id": "EMP101", "is_active": True},
+            {"first_name": "Jane", "last_name": "Server", "employee_id": "EMP102", "is_active": False},
+        ]),
+        (TableAssignmentModel, ("table_id", "party_id", "server_id"), [
+            {"assigned_at": SEATING_TIME, "status": "ACTIVE"},
+            {"assigned_at": datetime(2025, 10, 20, 17, 0, 0), "status": "COMPLETED"},
+        ]),
+    ])
+    def test_model_bulk_creation(self, db_session, sample_restaurant, sample_party, sample_table, sample_server,
+                                 model, foreign_keys, rows):
+        """Test batched model creation fills keys and timestamps from column defaults."""
+        parents = {
+            "restaurant_id": sample_restaurant.id,
+            "party_id": sample_party.id,
+            "table_id": sample_table.id,
+            "server_id": sample_server.id,
+        }
+        rows = [{**row, **{fk: parents[fk] for fk in foreign_keys}} for row in rows]
         
-        assert reservation.id is not None
-        assert reservation.customer_name == "Test Customer"
-        assert reservation.party_size == 4
-        assert reservation.status == "CONFIRMED"
-    
-    def test_server_model_creation(self, db_session, sample_restaurant):
-        """Test Server model creation."""
-        server = ServerModel(
-            id=str(uuid.uuid4()),
-            restaurant_id=sample_restaurant.id,
-            first_name="John",
-            last_name="Server",
-            employee_id="EMP001",
-            is_active=True,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        db_session.add(server)
-        db_session.commit()
-        db_session.refresh(server)
+        created = bulk_create(db_session, model, rows)
         
-        assert server.id is not None
-        assert server.first_name == "John"
-        assert server.last_name == "Server"
-        assert server.employee_id == "EMP001"
-        assert server.is_active is True
+        assert len(created) == len(rows)
+        for record, row in zip(created, rows):
+            assert record.id is not None
+            assert record.created_at is not None
+            for field, value in row.items():
+                assert getattr(record, field) == value
     
-    def test_table_assignment_model_creation(self, db_session, sample_restaurant, sample_party, sample_table, sample_server):
-        """Test TableAssignment model creation."""
-        assignment = TableAssignmentModel(
-            id=str(uuid.uuid4()),
-            table_id=sample_table.id,
-            party_id=sample_party.id,
-            server_id=sample_server.id,
-            assigned_at=datetime(2025, 10, 20, 19, 0, 0),
-            status="ACTIVE",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+    def test_model_relationships(self, db_session, sample_restaurant, sample_section, sample_table):
+        """Test model relationships."""
+        query = (
+            select(RestaurantModel)
+            .where(RestaurantModel.id == sample_restaurant.id)
+            .options(selectinload(RestaurantModel.sections), selectinload(RestaurantModel.tables))
         )
-        db_session.add(assignment)
-        db_session.commit()
-        db_session.refresh(assignment)
+        with count_queries(db_session.connection()) as queries:
+            restaurant = db_session.execute(query).scalar_one()
+            
+            # Test restaurant -> sections relationship
+            assert len(restaurant.sections) == 1
+            assert restaurant.sections[0].name == "Main Dining"
+            
+            # Test restaurant -> tables relationship
+            assert len(restaurant.tables) == 1
+            assert restaurant.tables[0].table_number == "T-01"
         
-        assert assignment.id is not None
-        assert assignment.table_id == sample_table.id
-        assert assignment.party_id == sample_party.id
-        assert assignment.server_id == sample_server.id
-        assert assignment.status == "ACTIVE"
+        assert len(queries) <= 3
     
-    def test_model_relationships(self, db_session, sample_restaurant, sample_section, sample_table):
-        """Test model relationships."""
-        # Test restaurant -> sections relationship
-        sections = db_session.query(SectionModel).filter_by(restaurant_id=sample_restaurant.id).all()
-        assert len(sections) == 1
-        assert sections[0].name == "Main Dining"
+    def test_dump_model_serializes_orm_objects(self, sample_reservation):
+        """Test pre-serialized responses match the response schema."""
+        data = dump_model(Reservation, sample_reservation)
         
-        # Test restaurant -> tables relationship
-        tables = db_session.query(TableModel).filter_by(restaurant_id=sample_restaurant.id).all()
-        assert len(tables) == 1
-        assert tables[0].table_number == "T-01"
+        assert data["id"] == sample_reservation.id
+        assert data["status"] == "CONFIRMED"
+        assert data["reservation_time"] == SEATING_TIME
+        assert set(data) == set(Reservation.model_fields)
@@ -2,18 +2,32 @@
 Unit tests for service layer functions
 """
 import pytest
-from datetime import datetime, date, time
+from sqlalchemy import inspect
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session
-from unittest.mock import Mock, patch
 
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
 from app.services.restaurant_service import RestaurantService
 from app.services.party_service import PartyService
 from app.services.reservation_service import ReservationService
 from app.services.server_service import ServerService
 from app.services.assignment_service import AssignmentService
+from app.services.waiting_list_service import WaitingListService
 from app.models.database import (
-    Restaurant, Section, Table, Party, Reservation, Server, TableAssignment
+    Restaurant, Table, Party, Reservation, Server, WaitingList
 )
+from app.models.schemas import (
+    RestaurantCreate, RestaurantUpdate,
+    PartyCreate, PartyUpdate,
+    ReservationCreate, ReservationUpdate,
+    ServerCreate, ServerUpdate,
+    TableAssignmentCreate, TableAssignmentUpdate,
+    WaitingListCreate,
+    TableStatus, PartyStatus, WaitingListStatus
+)
+from tests._payloads import SEATING_TIME, NEXT_DAY_SEATING_TIME
+from tests._sql_count import count_queries
 
 
 class TestRestaurantService:
@@ -23,10 +37,12 @@ class TestRestaurantService:
         """Test getting restaurants with pagination."""
         service = RestaurantService(db_session)
         
-        # Test with default pagination
-        restaurants = service.get_restaurants()
-        assert len(restaurants) == 1
-        assert restaurants[0].name == "Test Restaurant"
+        # Test with default pagination; reading the rows issues no follow-up queries
+        with count_queries(db_session.connection()) as queries:
+            restaurants = service.get_restaurants()
+            assert len(restaurants) == 1
+            assert restaurants[0].name == "Test Restaurant"
+        assert len(queries) == 1
         
         # Test with custom pagination
         restaurants = service.get_restaurants(limit=10, offset=0)
@@ -40,7 +56,6 @@ class TestRestaurantService:
         """Test creating a new restaurant."""
         service = RestaurantService(db_session)
         
-        from app.models.schemas import RestaurantCreate
         restaurant_data = RestaurantCreate(
             name="New Restaurant",
             address="456 New St",
@@ -76,7 +91,6 @@ class TestRestaurantService:
         """Test updating a restaurant."""
         service = RestaurantService(db_session)
         
-        from app.models.schemas import RestaurantUpdate
         update_data = RestaurantUpdate(
             name="Updated Restaurant",
             max_capacity=200
@@ -88,31 +102,136 @@ class TestRestaurantService:
         assert updated_restaurant.address == "123 Test Street, Test City, TC 12345"  # Unchanged
         
         # Verify it was updated in database
-        db_restaurant = db_session.query(Restaurant).filter_by(id=sample_restaurant.id).first()
+        db_restaurant = db_session.get(Restaurant, sample_restaurant.id)
         assert db_restaurant.name == "Updated Restaurant"
         assert db_restaurant.max_capacity == 200
     
+    def test_get_tables_min_capacity(self, db_session: Session, sample_restaurant, sample_table):
+        """Test filtering tables by minimum capacity."""
+        service = RestaurantService(db_session)
+        
+        tables = service.get_tables(restaurant_id=sample_restaurant.id, min_capacity=4)
+        assert len(tables) == 1
+        assert tables[0].id == sample_table.id
+        
+        tables = service.get_tables(restaurant_id=sample_restaurant.id, min_capacity=5)
+        assert len(tables) == 0
+    
+    def test_list_queries_raise_on_lazy_load(self, db_session: Session, sample_restaurant, sample_table):
+        """Test list queries refuse relationship lazy loads under the test settings."""
+        service = RestaurantService(db_session)
+        
+        tables = service.get_tables(restaurant_id=sample_restaurant.id)
+        with pytest.raises(InvalidRequestError):
+            tables[0].restaurant
+    
+    def test_table_availability_cached(self, db_session: Session, sample_restaurant, sample_table):
+        """Test repeated availability checks are served from the cache until a table changes."""
+        service = RestaurantService(db_session)
+        date_time = SEATING_TIME
+        
+        availability = service.check_table_availability(sample_restaurant.id, date_time, party_size=4)
+        assert [table.id for table in availability.available_tables] == [sample_table.id]
+        
+        with count_queries(db_session.connection()) as queries:
+            assert service.check_table_availability(sample_restaurant.id, date_time, party_size=4) is availability
+        assert len(queries) == 0
+        
+        # A flushed write only invalidates once it commits, so no reader can re-cache the old rows
+        sample_table.status = "OCCUPIED"
+        db_session.flush()
+        assert service.check_table_availability(sample_restaurant.id, date_time, party_size=4) is availability
+        db_session.commit()
+        
+        availability = service.check_table_availability(sample_restaurant.id, date_time, party_size=4)
+        assert availability.available_tables == []
+    
+    def test_occupancy_analytics_cached(self, db_session: Session, sample_restaurant, sample_table):
+        """Test repeated occupancy analytics are served from the cache until a table changes."""
+        service = RestaurantService(db_session)
+        restaurant_id = sample_restaurant.id
+        
+        with count_queries(db_session.connection()) as queries:
+            analytics = service.get_occupancy_analytics(restaurant_id)
+        assert len(queries) == 1
+        assert analytics.total_tables == 1
+        assert analytics.occupied_tables == 0
+        
+        with count_queries(db_session.connection()) as queries:
+            assert service.get_occupancy_analytics(restaurant_id) is analytics
+        assert len(queries) == 0
+        
+        sample_table.status = "OCCUPIED"
+        db_session.commit()
+        
+        analytics = service.get_occupancy_analytics(restaurant_id)
+        assert analytics.occupied_tables == 1
+        assert analytics.current_occupancy == 100.0
+    
     def test_delete_restaurant(self, db_session: Session, sample_restaurant):
         """Test deleting a restaurant."""
         service = RestaurantService(db_session)
         
         # Verify restaurant exists
-        restaurant = db_session.query(Restaurant).filter_by(id=sample_restaurant.id).first()
+        restaurant = db_session.get(Restaurant, sample_restaurant.id)
         assert restaurant is not None
         
         # Delete restaurant
         result = service.delete_restaurant(sample_restaurant.id)
         assert result is True
         
-        # Verify restaurant was deleted
-        restaurant = db_session.query(Restaurant).filter_by(id=sample_restaurant.id).first()
-        assert restaurant is None
+        # Verify restaurant was deleted; the committed DELETE detaches the instance, no SELECT needed
+        assert inspect(sample_restaurant).was_deleted
+        assert sample_restaurant not in db_session
         
         # Test deleting non-existent restaurant
         result = service.delete_restaurant("non-existent-id")
         assert result is False
 
 
+@pytest.mark.no_db
+class TestTTLCache:
+    """Test the bounded result cache behind table availability and occupancy."""
+    
+    def test_set_evicts_oldest_entries_beyond_max(self):
+        """Test the cache never holds more than max_entries values."""
+        cache = TTLCache(ttl=30, max_entries=2)
+        for minute in range(3):
+            cache.set("restaurant", minute, minute)
+        
+        assert len(cache) == 2
+        assert cache.get("restaurant", 0) is None
+        assert cache.get("restaurant", 2) == 2
+    
+    def test_set_evicts_expired_entries(self, monkeypatch):
+        """Test expired entries are dropped on set even if they are never read again."""
+        now = 1000.0
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+        cache = TTLCache(ttl=30)
+        cache.set("restaurant", "old", 1)
+        
+        now += 31
+        cache.set("other", "new", 2)
+        assert len(cache) == 1
+        assert cache.get("other", "new") == 2
+    
+    def test_invalidate_drops_only_the_scope(self):
+        """Test invalidating one restaurant keeps the others cached."""
+        cache = TTLCache(ttl=30)
+        cache.set("first", "key", 1)
+        cache.set("second", "key", 2)
+        
+        cache.invalidate("first")
+        assert cache.get("first", "key") is None
+        assert cache.get("second", "key") == 2
+    
+    def test_zero_ttl_disables_caching(self):
+        """Test the default TTL of 0 caches nothing."""
+        cache = TTLCache(ttl=0)
+        cache.set("restaurant", "key", 1)
+        assert cache.get("restaurant", "key") is None
+
+
 class TestPartyService:
     """Test PartyService functionality."""
     
@@ -128,7 +247,6 @@ class TestPartyService:
         """Test creating a new party."""
         service = PartyService(db_session)
         
-        from app.models.schemas import PartyCreate
         party_data = PartyCreate(
             name="New Party",
             phone="+1-555-0456",
@@ -158,7 +276,6 @@ class TestPartyService:
         """Test updating a party."""
         service = PartyService(db_session)
         
-        from app.models.schemas import PartyUpdate
         update_data = PartyUpdate(
             name="Updated Party",
             size=8
@@ -176,9 +293,9 @@ class TestPartyService:
         result = service.delete_party(sample_party.id)
         assert result is True
         
-        # Verify party was deleted
-        party = db_session.query(Party).filter_by(id=sample_party.id).first()
-        assert party is None
+        # Verify party was deleted; the committed DELETE detaches the instance, no SELECT needed
+        assert inspect(sample_party).was_deleted
+        assert sample_party not in db_session
 
 
 class TestReservationService:
@@ -196,10 +313,9 @@ class TestReservationService:
         """Test creating a new reservation."""
         service = ReservationService(db_session)
         
-        from app.models.schemas import ReservationCreate
         reservation_data = ReservationCreate(
             restaurant_id=sample_restaurant.id,
-            reservation_time=datetime(2025, 10, 21, 20, 0, 0),
+            reservation_time=NEXT_DAY_SEATING_TIME,
             party_size=4,
             customer_name="New Customer",
             customer_phone="+1-555-0456",
@@ -228,7 +344,6 @@ class TestReservationService:
         """Test updating a reservation."""
         service = ReservationService(db_session)
         
-        from app.models.schemas import ReservationUpdate
         update_data = ReservationUpdate(
             customer_name="Updated Customer",
             special_requests="Updated requests"
@@ -246,9 +361,9 @@ class TestReservationService:
         result = service.delete_reservation(sample_reservation.id)
         assert result is True
         
-        # Verify reservation was deleted
-        reservation = db_session.query(Reservation).filter_by(id=sample_reservation.id).first()
-        assert reservation is None
+        # Verify reservation was deleted; the committed DELETE detaches the instance, no SELECT needed
+        assert inspect(sample_reservation).was_deleted
+        assert sample_reservation not in db_session
 
 
 class TestServerService:
@@ -266,7 +381,6 @@ class TestServerService:
         """Test creating a new server."""
         service = ServerService(db_session)
         
-        from app.models.schemas import ServerCreate
         server_data = ServerCreate(
             restaurant_id=sample_restaurant.id,
             first_name="Jane",
@@ -296,7 +410,6 @@ class TestServerService:
         """Test updating a server."""
         service = ServerService(db_session)
         
-        from app.models.schemas import ServerUpdate
         update_data = ServerUpdate(
             first_name="Johnny"
         )
@@ -312,72 +425,85 @@ class TestServerService:
         result = service.delete_server(sample_server.id)
         assert result is True
         
-        # Verify server was deleted
-        server = db_session.query(Server).filter_by(id=sample_server.id).first()
-        assert server is None
+        # Verify server was deleted; the committed DELETE detaches the instance, no SELECT needed
+        assert inspect(sample_server).was_deleted
+        assert sample_server not in db_session
 
 
 class TestAssignmentService:
     """Test AssignmentService functionality."""
     
-    def test_get_table_assignments(self, db_session: Session, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_get_table_assignments(self, db_session: Session, sample_table, created_assignment):
         """Test getting table assignments."""
         service = AssignmentService(db_session)
         
-        # Create a table assignment
-        from app.models.schemas import TableAssignmentCreate
-        assignment_data = TableAssignmentCreate(
-            table_id=sample_table.id,
-            party_id=sample_party.id,
-            server_id=sample_server.id,
-            assigned_at=datetime(2025, 10, 20, 19, 0, 0),
-            status="ASSIGNED"
-        )
-        
-        assignment = service.create_table_assignment(assignment_data)
-        assert assignment.table_id == sample_table.id
-        assert assignment.party_id == sample_party.id
-        assert assignment.server_id == sample_server.id
-        
-        # Test getting assignments
         assignments = service.get_table_assignments()
         assert len(assignments) == 1
+        assert assignments[0].id == created_assignment.id
         assert assignments[0].table_id == sample_table.id
     
-    def test_create_table_assignment(self, db_session: Session, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_create_table_assignment(self, db_session: Session, sample_party, sample_table, sample_server):
         """Test creating a table assignment."""
         service = AssignmentService(db_session)
         
-        from app.models.schemas import TableAssignmentCreate
         assignment_data = TableAssignmentCreate(
             table_id=sample_table.id,
             party_id=sample_party.id,
             server_id=sample_server.id,
-            assigned_at=datetime(2025, 10, 20, 19, 0, 0),
+            assigned_at=SEATING_TIME,
             status="ASSIGNED"
         )
         
-        assignment = service.create_table_assignment(assignment_data)
+        # The guarded claims must not use UPDATE ... RETURNING, which MySQL does not support
+        with count_queries(db_session.connection()) as queries:
+            assignment = service.create_table_assignment(assignment_data)
+        updates = [query for query in queries if query.startswith("UPDATE")]
+        assert len(updates) == 2
+        assert not any("RETURNING" in query for query in updates)
+        
         assert assignment.table_id == sample_table.id
         assert assignment.party_id == sample_party.id
+        assert assignment.server_id == sample_server.id
         assert assignment.status == "ACTIVE"  # Default status is ACTIVE
         assert assignment.id is not None
     
-    def test_get_table_assignment(self, db_session: Session, sample_restaurant, sample_party, sample_table, sample_server):
-        """Test getting a specific table assignment."""
+    def test_create_table_assignment_invalidates_availability(self, db_session: Session, sample_restaurant,
+                                                             sample_party, sample_table, sample_server):
+        """Test the guarded table claim drops the restaurant's cached availability on commit."""
+        restaurant_service = RestaurantService(db_session)
+        availability = restaurant_service.check_table_availability(sample_restaurant.id, SEATING_TIME, party_size=4)
+        assert len(availability.available_tables) == 1
+        
+        AssignmentService(db_session).create_table_assignment(TableAssignmentCreate(
+            table_id=sample_table.id,
+            party_id=sample_party.id,
+            server_id=sample_server.id
+        ))
+        
+        availability = restaurant_service.check_table_availability(sample_restaurant.id, SEATING_TIME, party_size=4)
+        assert availability.available_tables == []
+    
+    def test_create_table_assignment_unavailable_party_keeps_table(self, db_session: Session, sample_party, sample_table, sample_server):
+        """Test a rejected party rolls back the table claim."""
         service = AssignmentService(db_session)
+        sample_party.status = "SEATED"
+        db_session.commit()
         
-        # Create assignment first
-        from app.models.schemas import TableAssignmentCreate
         assignment_data = TableAssignmentCreate(
             table_id=sample_table.id,
             party_id=sample_party.id,
-            server_id=sample_server.id,
-            assigned_at=datetime(2025, 10, 20, 19, 0, 0),
-            status="ASSIGNED"
+            server_id=sample_server.id
         )
         
-        created_assignment = service.create_table_assignment(assignment_data)
+        with pytest.raises(ValueError, match="Party is not available"):
+            service.create_table_assignment(assignment_data)
+        
+        table = db_session.get(Table, sample_table.id)
+        assert table.status is TableStatus.AVAILABLE
+    
+    def test_get_table_assignment(self, db_session: Session, sample_table, created_assignment):
+        """Test getting a specific table assignment."""
+        service = AssignmentService(db_session)
         
         # Test getting the assignment
         assignment = service.get_table_assignment(created_assignment.id)
@@ -388,24 +514,11 @@ class TestAssignmentService:
         assignment = service.get_table_assignment("non-existent-id")
         assert assignment is None
     
-    def test_update_table_assignment(self, db_session: Session, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_update_table_assignment(self, db_session: Session, created_assignment):
         """Test updating a table assignment."""
         service = AssignmentService(db_session)
         
-        # Create assignment first
-        from app.models.schemas import TableAssignmentCreate
-        assignment_data = TableAssignmentCreate(
-            table_id=sample_table.id,
-            party_id=sample_party.id,
-            server_id=sample_server.id,
-            assigned_at=datetime(2025, 10, 20, 19, 0, 0),
-            status="ASSIGNED"
-        )
-        
-        created_assignment = service.create_table_assignment(assignment_data)
-        
         # Update assignment
-        from app.models.schemas import TableAssignmentUpdate
         update_data = TableAssignmentUpdate(
             status="COMPLETED",
             notes="Service completed successfully"
@@ -415,26 +528,105 @@ class TestAssignmentService:
         assert updated_assignment.status == "COMPLETED"
         assert updated_assignment.notes == "Service completed successfully"
     
-    def test_delete_table_assignment(self, db_session: Session, sample_restaurant, sample_party, sample_table, sample_server):
+    def test_delete_table_assignment(self, db_session: Session, created_assignment):
         """Test deleting a table assignment."""
         service = AssignmentService(db_session)
         
-        # Create assignment first
-        from app.models.schemas import TableAssignmentCreate
-        assignment_data = TableAssignmentCreate(
-            table_id=sample_table.id,
-            party_id=sample_party.id,
-            server_id=sample_server.id,
-            assigned_at=datetime(2025, 10, 20, 19, 0, 0),
-            status="ASSIGNED"
-        )
-        
-        created_assignment = service.create_table_assignment(assignment_data)
-        
         # Delete assignment
         result = service.delete_table_assignment(created_assignment.id)
         assert result is True
         
-        # Verify assignment was deleted
-        assignment = db_session.query(TableAssignment).filter_by(id=created_assignment.id).first()
-        assert assignment is None
+        # Verify assignment was deleted; the committed DELETE detaches the instance, no SELECT needed
+        assert inspect(created_assignment).was_deleted
+        assert created_assignment not in db_session
+
+
+class TestWaitingListService:
+    """Test WaitingListService functionality."""
+    
+    def test_seat_waiting_party(self, db_session: Session, sample_restaurant, sample_table, sample_server):
+        """Test seating a waiting list party in a single operation."""
+        service = WaitingListService(db_session)
+        
+        entry = service.add_to_waiting_list(WaitingListCreate(
+            restaurant_id=sample_restaurant.id,
+            customer_name="Walk-in Customer",
+            customer_phone="+1-555-0789",
+            party_size=3,
+            estimated_wait_time=15
+        ))
+        
+        assignment = service.seat_waiting_party(entry.id, table_id=sample_table.id, server_id=sample_server.id)
+        assert assignment is not None
+        assert assignment.table_id == sample_table.id
+        assert assignment.server_id == sample_server.id
+        
+        # Verify party, table and waiting list entry were all updated
+        party = db_session.get(Party, assignment.party_id)
+        assert party.name == "Walk-in Customer"
+        assert party.size == 3
+        assert party.status is PartyStatus.SEATED
+        
+        table = db_session.get(Table, sample_table.id)
+        assert table.status is TableStatus.OCCUPIED
+        
+        entry = db_session.get(WaitingList, entry.id)
+        assert entry.status is WaitingListStatus.SEATED
+        
+        # Seating the same entry again is rejected
+        with pytest.raises(ValueError):
+            service.seat_waiting_party(entry.id, table_id=sample_table.id, server_id=sample_server.id)
+        
+        # Test with non-existent ID
+        assert service.seat_waiting_party("non-existent-id", table_id=sample_table.id, server_id=sample_server.id) is None
+    
+    def test_seat_waiting_party_rejects_taken_table(self, db_session: Session, sample_restaurant, sample_table, sample_server):
+        """Test a table already seated elsewhere rolls back the waiting list claim."""
+        service = WaitingListService(db_session)
+        entry = service.add_to_waiting_list(WaitingListCreate(
+            restaurant_id=sample_restaurant.id,
+            customer_name="Walk-in Customer",
+            customer_phone="+1-555-0789",
+            party_size=3
+        ))
+        sample_table.status = "OCCUPIED"
+        db_session.commit()
+        
+        with pytest.raises(ValueError, match="Table is not available"):
+            service.seat_waiting_party(entry.id, table_id=sample_table.id, server_id=sample_server.id)
+        
+        entry = db_session.get(WaitingList, entry.id)
+        assert entry.status is WaitingListStatus.WAITING
+    
+    def test_seat_waiting_party_rejects_other_restaurant(self, db_session: Session, sample_restaurant,
+                                                         sample_table, sample_server):
+        """Test a party cannot be seated at another restaurant's table or with its server."""
+        service = WaitingListService(db_session)
+        other = RestaurantService(db_session).create_restaurant(RestaurantCreate(
+            name="Other Restaurant",
+            address="789 Other St",
+            phone="+1-555-0999",
+            opening_time="10:00:00",
+            closing_time="23:00:00",
+            max_capacity=50
+        ))
+        entry = service.add_to_waiting_list(WaitingListCreate(
+            restaurant_id=other.id,
+            customer_name="Walk-in Customer",
+            customer_phone="+1-555-0789",
+            party_size=3
+        ))
+        other_server = ServerService(db_session).create_server(ServerCreate(
+            restaurant_id=other.id,
+            first_name="Olive",
+            last_name="Server",
+            employee_id="EMP900"
+        ))
+        
+        with pytest.raises(ValueError, match="Table is not available"):
+            service.seat_waiting_party(entry.id, table_id=sample_table.id, server_id=other_server.id)
+        with pytest.raises(ValueError, match="Server is not available"):
+            service.seat_waiting_party(entry.id, table_id=sample_table.id, server_id=sample_server.id)
+        
+        assert db_session.get(Table, sample_table.id).status is TableStatus.AVAILABLE
+        assert db_session.get(WaitingList, entry.id).status is WaitingListStatus.WAITING
@@ -2,19 +2,24 @@
 Simple unit tests for the restaurant seating system
 """
 import pytest
-from datetime import datetime, date, time
 from pydantic import ValidationError
 
 # Import app modules (PYTHONPATH should be set to include backend/)
 from app.models.schemas import (
     Restaurant, RestaurantCreate, RestaurantUpdate,
-    Table, TableCreate, TableUpdate,
-    Party, PartyCreate, PartyUpdate,
-    Reservation, ReservationCreate, ReservationUpdate,
-    Server, ServerCreate, ServerUpdate,
-    TableAssignment, TableAssignmentCreate, TableAssignmentUpdate,
+    Table, TableCreate,
+    Party, PartyCreate,
+    ReservationCreate,
+    ServerCreate,
+    TableAssignmentCreate,
     TableStatus, PartyStatus, ReservationStatus, AssignmentStatus
 )
+from tests._payloads import (
+    SEATING_TIME, CREATED_AT,
+    RESTAURANT_ID, PARTY_ID, TABLE_ID,
+    RESTAURANT_PAYLOAD, TABLE_PAYLOAD, PARTY_PAYLOAD,
+    RESERVATION_PAYLOAD, SERVER_PAYLOAD, TABLE_ASSIGNMENT_PAYLOAD
+)
 
 
 class TestPydanticModels:
@@ -23,15 +28,7 @@ class TestPydanticModels:
     def test_restaurant_create_validation(self):
         """Test RestaurantCreate model validation."""
         # Valid data
-        valid_data = {
-            "name": "Test Restaurant",
-            "address": "123 Test St",
-            "phone": "+1-555-0123",
-            "opening_time": "09:00:00",
-            "closing_time": "22:00:00",
-            "max_capacity": 100
-        }
-        restaurant = RestaurantCreate(**valid_data)
+        restaurant = RestaurantCreate(**RESTAURANT_PAYLOAD)
         assert restaurant.name == "Test Restaurant"
         assert restaurant.max_capacity == 100
         
@@ -51,111 +48,54 @@ class TestPydanticModels:
         empty_update = RestaurantUpdate()
         assert empty_update.name is None
     
-    def test_table_status_enum(self):
-        """Test TableStatus enum values."""
-        assert TableStatus.AVAILABLE == "AVAILABLE"
-        assert TableStatus.OCCUPIED == "OCCUPIED"
-        assert TableStatus.RESERVED == "RESERVED"
-        assert TableStatus.OUT_OF_ORDER == "OUT_OF_ORDER"
-        assert TableStatus.CLEANING == "CLEANING"
-    
-    def test_party_status_enum(self):
-        """Test PartyStatus enum values."""
-        assert PartyStatus.WAITING == "WAITING"
-        assert PartyStatus.SEATED == "SEATED"
-        assert PartyStatus.FINISHED == "FINISHED"
-        assert PartyStatus.CANCELLED == "CANCELLED"
-    
-    def test_reservation_status_enum(self):
-        """Test ReservationStatus enum values."""
-        assert ReservationStatus.PENDING == "PENDING"
-        assert ReservationStatus.CONFIRMED == "CONFIRMED"
-        assert ReservationStatus.CANCELLED == "CANCELLED"
-        assert ReservationStatus.NO_SHOW == "NO_SHOW"
-        assert ReservationStatus.COMPLETED == "COMPLETED"
+    @pytest.mark.parametrize("enum_cls,values", [
+        (TableStatus, ["AVAILABLE", "OCCUPIED", "RESERVED", "OUT_OF_ORDER", "CLEANING"]),
+        (PartyStatus, ["WAITING", "SEATED", "FINISHED", "CANCELLED"]),
+        (ReservationStatus, ["PENDING", "CONFIRMED", "CANCELLED", "NO_SHOW", "COMPLETED"]),
+        (AssignmentStatus, ["ACTIVE", "COMPLETED", "CANCELLED"]),
+    ])
+    def test_status_enum_values(self, enum_cls, values):
+        """Test status enum members match their wire values."""
+        for value in values:
+            assert getattr(enum_cls, value) == value
     
     def test_table_create_validation(self):
         """Test TableCreate model validation."""
-        valid_data = {
-            "restaurant_id": "123e4567-e89b-12d3-a456-426614174000",
-            "table_number": "T-01",
-            "capacity": 4,
-            "location": "Near window",
-            "status": "AVAILABLE"
-        }
-        table = TableCreate(**valid_data)
+        table = TableCreate(**TABLE_PAYLOAD)
         assert table.table_number == "T-01"
         assert table.capacity == 4
         assert table.status == TableStatus.AVAILABLE
         
         # Invalid status
         with pytest.raises(ValidationError):
-            TableCreate(
-                restaurant_id="123e4567-e89b-12d3-a456-426614174000",
-                table_number="T-01",
-                capacity=4,
-                location="Near window",
-                status="INVALID_STATUS"
-            )
+            TableCreate(**TABLE_PAYLOAD | {"status": "INVALID_STATUS"})
     
     def test_party_create_validation(self):
         """Test PartyCreate model validation."""
-        valid_data = {
-            "name": "Test Party",
-            "phone": "+1-555-0123",
-            "email": "test@example.com",
-            "size": 4,
-            "status": "WAITING"
-        }
-        party = PartyCreate(**valid_data)
+        party = PartyCreate(**PARTY_PAYLOAD)
         assert party.name == "Test Party"
         assert party.size == 4
         assert party.status == PartyStatus.WAITING
     
     def test_reservation_create_validation(self):
         """Test ReservationCreate model validation."""
-        valid_data = {
-            "restaurant_id": "123e4567-e89b-12d3-a456-426614174000",
-            "reservation_time": datetime(2025, 10, 20, 19, 0, 0),
-            "party_size": 4,
-            "customer_name": "Test Customer",
-            "customer_phone": "+1-555-0123",
-            "customer_email": "test@example.com",
-            "special_requests": "Window table"
-        }
-        reservation = ReservationCreate(**valid_data)
+        reservation = ReservationCreate(**RESERVATION_PAYLOAD)
         assert reservation.customer_name == "Test Customer"
         assert reservation.party_size == 4
-        assert reservation.restaurant_id == "123e4567-e89b-12d3-a456-426614174000"
+        assert reservation.restaurant_id == RESTAURANT_ID
     
     def test_server_create_validation(self):
         """Test ServerCreate model validation."""
-        valid_data = {
-            "restaurant_id": "123e4567-e89b-12d3-a456-426614174000",
-            "first_name": "John",
-            "last_name": "Server",
-            "employee_id": "EMP001",
-            "phone": "+1-555-0199",
-            "email": "john@test.com",
-            "is_active": True
-        }
-        server = ServerCreate(**valid_data)
+        server = ServerCreate(**SERVER_PAYLOAD)
         assert server.first_name == "John"
         assert server.last_name == "Server"
         assert server.employee_id == "EMP001"
     
     def test_table_assignment_create_validation(self):
         """Test TableAssignmentCreate model validation."""
-        valid_data = {
-            "restaurant_id": "123e4567-e89b-12d3-a456-426614174000",
-            "table_id": "123e4567-e89b-12d3-a456-426614174002",
-            "party_id": "123e4567-e89b-12d3-a456-426614174001",
-            "server_id": "123e4567-e89b-12d3-a456-426614174003",
-            "assigned_at": datetime(2025, 10, 20, 19, 0, 0)
-        }
-        assignment = TableAssignmentCreate(**valid_data)
-        assert assignment.table_id == "123e4567-e89b-12d3-a456-426614174002"
-        assert assignment.party_id == "123e4567-e89b-12d3-a456-426614174001"
+        assignment = TableAssignmentCreate(**TABLE_ASSIGNMENT_PAYLOAD)
+        assert assignment.table_id == TABLE_ID
+        assert assignment.party_id == PARTY_ID
 
 
 class TestModelSerialization:
@@ -163,19 +103,13 @@ class TestModelSerialization:
     
     def test_restaurant_serialization(self):
         """Test Restaurant model serialization."""
-        restaurant_data = {
+        restaurant_data = RESTAURANT_PAYLOAD | {
             "id": "123e4567-e89b-12d3-a456-426614174000",
-            "name": "Test Restaurant",
-            "address": "123 Test St",
-            "phone": "+1-555-0123",
-            "opening_time": "09:00:00",
-            "closing_time": "22:00:00",
-            "max_capacity": 100,
-            "created_at": datetime(2025, 10, 20, 10, 0, 0),
-            "updated_at": datetime(2025, 10, 20, 10, 0, 0)
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT
         }
         
-        restaurant = Restaurant(**restaurant_data)
+        restaurant = Restaurant.model_validate(restaurant_data)
         assert restaurant.name == "Test Restaurant"
         assert restaurant.max_capacity == 100
         
@@ -186,19 +120,14 @@ class TestModelSerialization:
     
     def test_table_serialization(self):
         """Test Table model serialization."""
-        table_data = {
+        table_data = TABLE_PAYLOAD | {
             "id": "123e4567-e89b-12d3-a456-426614174001",
-            "restaurant_id": "123e4567-e89b-12d3-a456-426614174000",
-            "table_number": "T-01",
-            "capacity": 4,
-            "location": "Near window",
-            "status": "AVAILABLE",
             "is_active": True,
-            "created_at": datetime(2025, 10, 20, 10, 0, 0),
-            "updated_at": datetime(2025, 10, 20, 10, 0, 0)
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT
         }
         
-        table = Table(**table_data)
+        table = Table.model_validate(table_data)
         assert table.table_number == "T-01"
         assert table.capacity == 4
         assert table.status == TableStatus.AVAILABLE
@@ -211,19 +140,14 @@ class TestModelSerialization:
     
     def test_party_serialization(self):
         """Test Party model serialization."""
-        party_data = {
+        party_data = PARTY_PAYLOAD | {
             "id": "123e4567-e89b-12d3-a456-426614174002",
-            "name": "Test Party",
-            "phone": "+1-555-0123",
-            "email": "test@example.com",
-            "size": 4,
-            "status": "WAITING",
-            "arrival_time": datetime(2025, 10, 20, 19, 0, 0),
-            "created_at": datetime(2025, 10, 20, 10, 0, 0),
-            "updated_at": datetime(2025, 10, 20, 10, 0, 0)
+            "arrival_time": SEATING_TIME,
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT
         }
         
-        party = Party(**party_data)
+        party = Party.model_validate(party_data)
         assert party.name == "Test Party"
         assert party.size == 4
         assert party.status == PartyStatus.WAITING
@@ -238,73 +162,29 @@ class TestModelSerialization:
 class TestValidationEdgeCases:
     """Test validation edge cases and error handling."""
     
-    def test_invalid_email_format(self):
-        """Test invalid email format validation."""
-        with pytest.raises(ValidationError) as exc_info:
-            PartyCreate(
-                name="Test Party",
-                phone="+1-555-0123",
-                email="invalid-email-format",
-                size=4,
-                status="WAITING"
-            )
-        
-        errors = exc_info.value.errors()
-        assert any(error["type"] == "value_error" for error in errors)
-    
-    def test_invalid_phone_format(self):
-        """Test invalid phone format validation."""
+    @pytest.mark.parametrize("model,payload,error_type", [
+        pytest.param(PartyCreate, PARTY_PAYLOAD | {"email": "invalid-email-format"}, "value_error",
+                     id="invalid_email_format"),
         # Phone validation is not implemented, so this should pass
-        party = PartyCreate(
-            name="Test Party",
-            phone="invalid-phone",
-            email="test@example.com",
-            size=4,
-            status="WAITING"
-        )
-        assert party.phone == "invalid-phone"
-    
-    def test_negative_capacity(self):
-        """Test negative capacity validation."""
-        with pytest.raises(ValidationError) as exc_info:
-            TableCreate(
-                restaurant_id="123e4567-e89b-12d3-a456-426614174000",
-                table_number="T-01",
-                capacity=-1,
-                location="Near window",
-                status="AVAILABLE"
-            )
-        
-        errors = exc_info.value.errors()
-        assert any(error["type"] == "greater_than_equal" for error in errors)
-    
-    def test_zero_capacity(self):
-        """Test zero capacity validation."""
-        with pytest.raises(ValidationError) as exc_info:
-            TableCreate(
-                restaurant_id="123e4567-e89b-12d3-a456-426614174000",
-                table_number="T-01",
-                capacity=0,
-                location="Near window",
-                status="AVAILABLE"
-            )
+        pytest.param(PartyCreate, PARTY_PAYLOAD | {"phone": "invalid-phone"}, None,
+                     id="invalid_phone_format"),
+        pytest.param(TableCreate, TABLE_PAYLOAD | {"capacity": -1}, "greater_than_equal",
+                     id="negative_capacity"),
+        pytest.param(TableCreate, TABLE_PAYLOAD | {"capacity": 0}, "greater_than_equal",
+                     id="zero_capacity"),
+        pytest.param(ReservationCreate, RESERVATION_PAYLOAD | {"reservation_time": "invalid-datetime"},
+                     "datetime_parsing", id="invalid_datetime_format"),
+    ])
+    def test_field_validation(self, model, payload, error_type):
+        """Test a single invalid field is rejected with the expected error type, or accepted."""
+        if error_type is None:
+            instance = model(**payload)
+            for field, value in payload.items():
+                assert getattr(instance, field) == value
+            return
         
-        errors = exc_info.value.errors()
-        assert any(error["type"] == "greater_than_equal" for error in errors)
-    
-    def test_invalid_datetime_format(self):
-        """Test invalid datetime format validation."""
         with pytest.raises(ValidationError) as exc_info:
-            ReservationCreate(
-                restaurant_id="123e4567-e89b-12d3-a456-426614174000",
-                party_id="123e4567-e89b-12d3-a456-426614174001",
-                reservation_time="invalid-datetime",
-                party_size=4,
-                customer_name="Test Customer",
-                customer_phone="+1-555-0123",
-                customer_email="test@example.com",
-                status="CONFIRMED"
-            )
+            model(**payload)
         
         errors = exc_info.value.errors()
-        assert any(error["type"] == "datetime_parsing" for error in errors)
+        assert any(error["type"] == error_type for error in errors)